@@ -0,0 +1,73 @@
+"""
+Append throughput of a SinglyLinkedList behind one global lock versus a ConcurrentSinglyLinkedList
+Run directly: python benchmark_concurrent.py
+"""
+import gc
+from threading import Lock, Thread
+from timeit import default_timer
+from typing import Callable, Dict, TypeVar
+
+from singly_linked_list import ConcurrentSinglyLinkedList, SinglyLinkedList
+
+T = TypeVar('T')  # generic type
+
+
+def benchmark_concurrent_append(threads: int = 4, per_thread: int = 50000) -> Dict[str, float]:
+    """
+    Compares multi-producer append throughput of a SinglyLinkedList behind one global lock with a
+    ConcurrentSinglyLinkedList, with and without a thread deleting concurrently
+    :param threads: number of appending threads
+    :param per_thread: number of appends made by each thread
+    :return: appends per second for each configuration, keyed by name
+    """
+
+    def run(append: Callable[[T], None], delete: Callable[[T], bool] = None) -> float:
+        """
+        Times `threads` producers appending, optionally alongside a thread deleting what they add
+        """
+        def produce(offset: int) -> None:
+            for i in range(per_thread):
+                append(offset + i)
+
+        def consume() -> None:
+            for i in range(0, per_thread, 100):
+                delete(i)
+
+        workers = [Thread(target=produce, args=(k * per_thread,)) for k in range(threads)]
+        if delete is not None:
+            workers.append(Thread(target=consume))
+        gc.collect()
+        start = default_timer()
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+        return threads * per_thread / (default_timer() - start)
+
+    results = {}
+
+    sll, big_lock = SinglyLinkedList(), Lock()
+
+    def locked_append(data: T) -> None:
+        with big_lock:
+            sll.append(data)
+
+    def locked_delete(data: T) -> bool:
+        with big_lock:
+            return sll.delete(data)
+
+    results['global lock'] = run(locked_append)
+    sll, big_lock = SinglyLinkedList(), Lock()
+    results['global lock + deletes'] = run(locked_append, locked_delete)
+
+    concurrent = ConcurrentSinglyLinkedList()
+    results['concurrent'] = run(concurrent.append)
+    concurrent = ConcurrentSinglyLinkedList()
+    results['concurrent + deletes'] = run(concurrent.append, concurrent.delete)
+
+    return results
+
+
+if __name__ == '__main__':
+    for name, rate in benchmark_concurrent_append().items():
+        print(f'{name:>24}: {rate:,.0f} appends/s')
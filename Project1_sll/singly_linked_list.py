@@ -1,10 +1,27 @@
-from typing import TypeVar  # For use in type hinting
+import os
+import pickle
+import struct
+import sys
+import tempfile
+from array import array
+from bisect import bisect_left
+from collections import deque
+from itertools import repeat
+from mmap import ACCESS_READ, mmap as memory_map
+from operator import is_
+from random import Random
+from threading import Lock
+from typing import Callable, Iterable, Iterator, List, TextIO, Tuple, TypeVar  # For use in type hinting
 
 # Type declarations
 T = TypeVar('T')        # generic type
 SLL = TypeVar('SLL')    # forward declared Singly Linked List type
 Node = TypeVar('Node')  # forward declared Node type
 
+# Order-sensitive fingerprint of an SLL: sum of hash(data_i) * BASE**i modulo a Mersenne prime
+_FP_MOD = (1 << 61) - 1
+_FP_BASE = 1_000_003
+
 
 class SLLNode:
     """
@@ -47,21 +64,282 @@ class SLLNode:
         return self is other if other is not None else False
 
 
+class SLLNodePool:
+    """
+    Bounded free list of unlinked SLLNodes that SLLs reuse instead of allocating new ones
+    Pooled nodes are chained through their own `next` references, so the pool allocates nothing itself
+    """
+
+    __slots__ = ['capacity', 'hits', 'misses', '_free', '_size']
+
+    def __init__(self, capacity: int = 1024) -> None:
+        """
+        Initializes an empty node pool
+        :param capacity: maximum number of idle nodes kept for reuse, extra released nodes are dropped
+        :return: None
+        """
+        self.capacity = capacity
+        self.hits = 0
+        self.misses = 0
+        self._free = None
+        self._size = 0
+
+    def __len__(self) -> int:
+        """
+        Number of idle nodes currently held by the pool
+        :return: number of pooled nodes
+        """
+        return self._size
+
+    def acquire(self, data: T) -> SLLNode:
+        """
+        Returns a detached node holding `data`, reusing a pooled node when one is available
+        :param data: data for the node to hold
+        :return: node whose `next` is None
+        """
+        node = self._free
+        if node is None:
+            self.misses += 1
+            return SLLNode(data)
+        self.hits += 1
+        self._free = node.next
+        self._size -= 1
+        node.data = data
+        node.next = None
+        return node
+
+    def release(self, node: SLLNode) -> None:
+        """
+        Takes back a node that is no longer linked into any SLL
+        The caller must not keep using `node`, it will be handed out again
+        :param node: node to recycle
+        :return: None
+        """
+        if self._size >= self.capacity:
+            return None
+        node.data = None
+        node.next = self._free
+        self._free = node
+        self._size += 1
+
+
+# On-disk SLL: header, then either a packed int64/float64 array or length-prefixed pickles
+_FILE_MAGIC = b'SLL1'
+_FILE_HEADER = struct.Struct('<4sBB2xQQ')   # magic, kind, little endian?, count, offset of the last record
+_RECORD_LENGTH = struct.Struct('<Q')
+_KIND_INT, _KIND_FLOAT, _KIND_PICKLE = ord('q'), ord('d'), ord('p')
+_NEXT_SLOT = SLLNode.next
+
+
+class _Pending:
+    """
+    Placeholder held in a mapped node's `next` slot until its successor is decoded
+    """
+
+    __slots__ = ['source', 'index', 'offset']
+
+    def __init__(self, source: '_MappedSource', index: int, offset: int) -> None:
+        """
+        Initialize a placeholder for a not yet decoded node
+        :param source: mapped file the node is decoded from
+        :param index: position of the node in the SLL
+        :param offset: byte offset of the node's record in the file
+        :return: None
+        """
+        self.source = source
+        self.index = index
+        self.offset = offset
+
+
+class _MappedNode(SLLNode):
+    """
+    SLLNode whose successor is decoded from a mapped file the first time `next` is read
+    Once its successor exists the node turns back into a plain SLLNode, so later traversals are full speed
+    """
+
+    __slots__ = ()
+
+    @property
+    def next(self) -> Node:
+        """
+        Successor of the node, decoding it on first access
+        :return: next node in the SLL
+        """
+        successor = _NEXT_SLOT.__get__(self)
+        if type(successor) is _Pending:
+            successor = successor.source.materialize(successor)
+            _NEXT_SLOT.__set__(self, successor)
+            self.__class__ = SLLNode
+        return successor
+
+    @next.setter
+    def next(self, node: Node) -> None:
+        """
+        Relinks the node, dropping any pending successor
+        :param node: new successor
+        :return: None
+        """
+        _NEXT_SLOT.__set__(self, node)
+        self.__class__ = SLLNode
+
+
+class _MappedSource:
+    """
+    Read-only mapping of a saved SLL that decodes nodes on demand
+    The mapping stays open for as long as some node still has a pending successor
+    """
+
+    __slots__ = ['buffer', 'values', 'count', 'tail']
+
+    def __init__(self, buffer: memory_map, kind: int, count: int) -> None:
+        """
+        Initialize a source over a mapped file
+        :param buffer: mapping of the whole file
+        :param kind: payload encoding of the file
+        :param count: number of payloads in the file
+        :return: None
+        """
+        self.buffer = buffer
+        self.count = count
+        self.tail = None
+        self.values = None
+        if kind != _KIND_PICKLE:
+            start = _FILE_HEADER.size
+            self.values = memoryview(buffer)[start:start + 8 * count].cast(chr(kind))
+
+    def decode(self, offset: int) -> Tuple[T, int]:
+        """
+        Decodes the pickled record at `offset`
+        :param offset: byte offset of the record
+        :return: (payload, offset of the following record)
+        """
+        length, = _RECORD_LENGTH.unpack_from(self.buffer, offset)
+        start = offset + _RECORD_LENGTH.size
+        return pickle.loads(self.buffer[start:start + length]), start + length
+
+    def materialize(self, pending: _Pending) -> SLLNode:
+        """
+        Builds the node a placeholder stands for, with its own successor still pending
+        :param pending: placeholder to resolve
+        :return: node at `pending.index`
+        """
+        if pending.index == self.count - 1:
+            return self.tail
+        if self.values is not None:
+            data, offset = self.values[pending.index], 0
+        else:
+            data, offset = self.decode(pending.offset)
+        node = _MappedNode.__new__(_MappedNode)
+        node.data = data
+        _NEXT_SLOT.__set__(node, _Pending(self, pending.index + 1, offset))
+        return node
+
+
+def _payload_hash(data: T) -> int:
+    """
+    Reduces a payload's hash for use in the SLL fingerprint
+    :param data: payload to hash
+    :return: hash of `data` modulo the fingerprint prime, None if `data` is unhashable
+    """
+    try:
+        return hash(data) % _FP_MOD
+    except TypeError:
+        return None
+
+
+def _ordering(comparator: Callable[[T, T], bool], descending: bool) -> Callable[[T, T], bool]:
+    """
+    Builds the "should come first" test used by the sorting module's `do_comparison`
+    :param comparator: returns True when the first argument should be treated as less than the second
+    :param descending: if True, reverse the order
+    :return: function returning True if its first argument should be placed before its second
+    """
+    if descending:
+        return lambda first, second: comparator(second, first) > 0
+    return lambda first, second: comparator(first, second) > 0
+
+
+def _cut_after(node: Node, count: int) -> Node:
+    """
+    Detaches the chain after the first `count` nodes starting at `node`
+    :param node: first node of the chain, may be None
+    :param count: number of nodes to keep attached to `node`
+    :return: first node of the detached remainder, None if there is none
+    """
+    for _ in range(count - 1):
+        if node is None:
+            return None
+        node = node.next
+    if node is None:
+        return None
+    rest = node.next
+    node.next = None
+    return rest
+
+
+def _merge_runs(left: Node, right: Node, before: Callable[[T, T], bool]) -> Tuple[Node, Node]:
+    """
+    Stably merges two sorted, None-terminated chains by relinking their nodes
+    :param left: head of the first chain, wins ties
+    :param right: head of the second chain, may be None
+    :param before: returns True if its first argument should be placed before its second
+    :return: (head, tail) of the merged chain
+    """
+    if right is None:
+        tail = left
+        while tail.next is not None:
+            tail = tail.next
+        return left, tail
+
+    if before(right.data, left.data):
+        head = tail = right
+        right = right.next
+    else:
+        head = tail = left
+        left = left.next
+    while left is not None and right is not None:
+        if before(right.data, left.data):
+            tail.next = tail = right
+            right = right.next
+        else:
+            tail.next = tail = left
+            left = left.next
+    tail.next = left if left is not None else right
+    while tail.next is not None:
+        tail = tail.next
+    return head, tail
+
+
 class SinglyLinkedList:
     """
     SLL implementation
     """
 
-    __slot__ = ['head', 'tail']
+    __slots__ = ['head', 'tail', '_size', '_total', '_total_valid', '_counts', '_index', '_prev',
+                 '_fingerprint', '_power', '_pool']
 
-    def __init__(self) -> None:
+    def __init__(self, count_values: bool = False, indexed: bool = False, pool: 'SLLNodePool' = None) -> None:
         """
         Initializes an SLL
+        Length, numeric total and (optionally) per-value occurrence counts are maintained
+        incrementally, so they stay correct only while the list is mutated through its methods
+        :param count_values: if True, keep a per-value occurrence counter so `find_sum` is O(1)
+        :param indexed: if True, keep a map from value identity to its nodes (in list order) and
+        from each node to its predecessor, making `find` O(1) and `delete` O(1) amortized
+        :param pool: node pool to take appended nodes from and return deleted nodes to, may be shared
         return: None
-        DO NOT MODIFY THIS FUNCTION
         """
         self.head = None
         self.tail = None
+        self._size = 0
+        self._total = 0
+        self._total_valid = True
+        self._counts = {} if count_values else None
+        self._index = {} if indexed else None
+        self._prev = {} if indexed else None
+        self._fingerprint = 0
+        self._power = 1
+        self._pool = pool
 
     def __repr__(self) -> str:
         """
@@ -74,28 +352,403 @@ class SinglyLinkedList:
     def __eq__(self, other: SLL) -> bool:
         """
         Overloads `==` operator to compare SLLs
+        Lists are equal if they hold equal data in the same order. Lengths and, when both are still
+        maintained, fingerprints reject most unequal lists in O(1); otherwise both chains are walked
+        iteratively, stopping at the first mismatch
         :param other: right operand of `==`
         :return: True if equal, else False
-        DO NOT MODIFY THIS FUNCTION
         """
-        comp = lambda n1, n2: n1 == n2 and (comp(n1.next, n2.next) if (n1 and n2) else True)
-        return comp(self.head, other.head)
+        if not isinstance(other, SinglyLinkedList):
+            return NotImplemented
+        if self.head is other.head:
+            return True
+        if self._size != other._size:
+            return False
+        if self._fingerprint is not None and other._fingerprint is not None \
+                and self._fingerprint != other._fingerprint:
+            return False
+
+        n1, n2 = self.head, other.head
+        while n1 is not None and n2 is not None:
+            if n1.data is not n2.data and not n1.data == n2.data:
+                return False
+            n1, n2 = n1.next, n2.next
+        return n1 is None and n2 is None
 
     # ========== Modify below ========== #
 
+    def __reduce__(self) -> tuple:
+        """
+        Pickles (and copies) the SLL as a flat list of its data, so nodes are not recursed into one by one
+        The SLL is rebuilt with the same counting and index options; a node pool is not carried over
+        :return: reconstruction recipe for `pickle`/`copy`
+        """
+        return self.__class__, (self._counts is not None, self._index is not None), list(self)
+
+    def __setstate__(self, state: List[T]) -> None:
+        """
+        Relinks an unpickled SLL from its flat list of data
+        :param state: data from head to tail
+        :return: None
+        """
+        self.extend(state)
+
+    def __iter__(self) -> Iterator[T]:
+        """
+        Lazily yields the data of each node from head to tail
+        :return: generator of data
+        """
+        curNode = self.head
+        while curNode is not None:
+            yield curNode.data
+            curNode = curNode.next
+
+    def iter_nodes(self) -> Iterator[Node]:
+        """
+        Lazily yields each node from head to tail
+        The successor is read before a node is yielded, so the caller may unlink the yielded node
+        :return: generator of nodes
+        """
+        curNode = self.head
+        while curNode is not None:
+            sucNode = curNode.next
+            yield curNode
+            curNode = sucNode
+
+    def window(self, k: int) -> Iterator[Tuple[T, ...]]:
+        """
+        Lazily yields every run of `k` consecutive data values, holding only `k` values at a time
+        :param k: window size
+        :return: generator of k-tuples, empty if the SLL has fewer than `k` nodes
+        """
+        if k < 1:
+            raise ValueError("window size must be positive")
+        current = deque(maxlen=k)
+        curNode = self.head
+        while curNode is not None:
+            current.append(curNode.data)
+            if len(current) == k:
+                yield tuple(current)
+            curNode = curNode.next
+
+    def skip(self, n: int) -> Iterator[T]:
+        """
+        Lazily yields the data of every node after the first `n`, like `islice(sll, n, None)`
+        :param n: number of leading nodes to skip
+        :return: generator of data
+        """
+        if n < 0:
+            raise ValueError("n must be non-negative")
+        curNode = self.head
+        while curNode is not None and n > 0:
+            curNode = curNode.next
+            n -= 1
+        while curNode is not None:
+            yield curNode.data
+            curNode = curNode.next
+
+    def take(self, n: int) -> Iterator[T]:
+        """
+        Lazily yields the data of the first `n` nodes, like `islice(sll, n)`
+        :param n: number of leading nodes to yield
+        :return: generator of data
+        """
+        if n < 0:
+            raise ValueError("n must be non-negative")
+        curNode = self.head
+        while curNode is not None and n > 0:
+            yield curNode.data
+            curNode = curNode.next
+            n -= 1
+
+    def _track_add(self, data: T) -> None:
+        """
+        Updates the maintained aggregates for a payload entering the SLL
+        :param data: data that was linked in
+        :return: None
+        """
+        if self._fingerprint is not None:
+            h = _payload_hash(data)
+            if h is None:
+                self._fingerprint = None
+            else:
+                self._fingerprint = (self._fingerprint + h * self._power) % _FP_MOD
+                self._power = self._power * _FP_BASE % _FP_MOD
+        self._size += 1
+        if self._total_valid:
+            if isinstance(data, (int, float)):
+                self._total += data
+            else:
+                self._total_valid = False
+        if self._counts is not None:
+            key = id(data)
+            self._counts[key] = self._counts.get(key, 0) + 1
+
+    def _track_remove(self, data: T, count: int = 1) -> None:
+        """
+        Updates the maintained aggregates for `count` occurrences of a payload leaving the SLL
+        The fingerprint depends on where the nodes were, so it is dropped until the SLL empties
+        :param data: data that was unlinked
+        :param count: number of nodes holding `data` that were unlinked
+        :return: None
+        """
+        self._size -= count
+        self._fingerprint = None
+        if self._size == 0:
+            self._total = 0
+            self._total_valid = True
+            self._fingerprint = 0
+            self._power = 1
+        elif self._total_valid:
+            # Only integer totals can be rolled back exactly, anything else is recomputed lazily
+            if isinstance(self._total, int) and isinstance(data, int):
+                self._total -= data * count
+            else:
+                self._total_valid = False
+        if self._counts is not None:
+            key = id(data)
+            remaining = self._counts.get(key, 0) - count
+            if remaining > 0:
+                self._counts[key] = remaining
+            else:
+                self._counts.pop(key, None)
+
+    def _index_add(self, node: Node, prevNode: Node) -> None:
+        """
+        Records a node that was linked in directly after `prevNode` in the index
+        Only valid when `node` becomes the last occurrence of its data
+        :param node: node that was linked in
+        :param prevNode: predecessor of `node`, None if `node` is the head
+        :return: None
+        """
+        self._prev[id(node)] = prevNode
+        occurrences = self._index.get(id(node.data))
+        if occurrences is None:
+            self._index[id(node.data)] = deque((node,))
+        else:
+            occurrences.append(node)
+
+    def _index_unlink(self, node: Node) -> None:
+        """
+        Unlinks `node` using its indexed predecessor and repairs the successor's predecessor
+        The caller is responsible for removing `node` from its data's occurrence deque
+        :param node: node to unlink
+        :return: None
+        """
+        prevNode = self._prev.pop(id(node))
+        sucNode = node.next
+        if prevNode is None:
+            self.head = sucNode
+        else:
+            prevNode.next = sucNode
+        if sucNode is None:
+            self.tail = prevNode
+        else:
+            self._prev[id(sucNode)] = prevNode
+        node.next = None
+        self._release(node)
+
+    def _indexed_delete(self, data: T, all: bool) -> bool:
+        """
+        Deletes the first (or every) occurrence of `data` through the index
+        :param data: data to remove
+        :param all: if True remove every occurrence, else only the first
+        :return: True if a node was removed, else False
+        """
+        occurrences = self._index.get(id(data))
+        if occurrences is None:
+            return False
+        if all:
+            del self._index[id(data)]
+            removed = len(occurrences)
+            for node in occurrences:
+                self._index_unlink(node)
+        else:
+            removed = 1
+            self._index_unlink(occurrences.popleft())
+            if not occurrences:
+                del self._index[id(data)]
+        self._track_remove(data, removed)
+        return True
+
+    def _release(self, node: Node) -> None:
+        """
+        Hands an unlinked node back to the node pool, if the SLL has one
+        :param node: node that is no longer linked into the SLL
+        :return: None
+        """
+        if self._pool is not None:
+            self._pool.release(node)
+
+    def _current_fingerprint(self) -> int:
+        """
+        Returns the order-sensitive fingerprint, recomputing it if a mutation invalidated it
+        :return: fingerprint of the SLL, None if some payload is unhashable
+        """
+        if self._fingerprint is None:
+            fingerprint, power = 0, 1
+            curNode = self.head
+            while curNode is not None:
+                h = _payload_hash(curNode.data)
+                if h is None:
+                    return None
+                fingerprint = (fingerprint + h * power) % _FP_MOD
+                power = power * _FP_BASE % _FP_MOD
+                curNode = curNode.next
+            self._fingerprint, self._power = fingerprint, power
+        return self._fingerprint
+
     def append(self, data: T) -> None:
         """
         Append an SLLNode to the end of the SLL
         :param data: data to append
         :return: None
         """
-        newNode = SLLNode(data)
+        newNode = SLLNode(data) if self._pool is None else self._pool.acquire(data)
+        if self._index is not None:
+            self._index_add(newNode, self.tail)
         if self.head is None:
             self.head = newNode
             self.tail = newNode
         else:
             self.tail.next = newNode
             self.tail = newNode
+        self._track_add(data)
+
+    @classmethod
+    def from_iterable(cls, it: Iterable[T], count_values: bool = False, indexed: bool = False,
+                      pool: 'SLLNodePool' = None) -> SLL:
+        """
+        Builds an SLL from any iterable in a single pass
+        :param it: iterable, generator or NumPy array of payloads, in order
+        :param count_values: see `__init__`
+        :param indexed: see `__init__`
+        :param pool: see `__init__`
+        :return: new SLL holding the payloads of `it`
+        """
+        sll = cls(count_values=count_values, indexed=indexed, pool=pool)
+        sll.extend(it)
+        return sll
+
+    def extend(self, it: Iterable[T]) -> None:
+        """
+        Appends every payload of `it` to the end of the SLL in a single pass
+        NumPy arrays (anything exposing `tolist`) are converted first so nodes hold Python scalars
+        :param it: iterable, generator or NumPy array of payloads, in order
+        :return: None
+        """
+        if hasattr(it, 'tolist'):
+            it = it.tolist()
+        if self._counts is not None or self._index is not None:
+            # Appending while iterating ourselves would chase the growing tail forever
+            if it is self:
+                it = list(it)
+            for data in it:
+                self.append(data)
+            return None
+
+        # Link behind a throwaway node so the empty-list case needs no per-element branch
+        start = SLLNode(None)
+        last = start
+        added = 0
+        total = self._total
+        numeric = self._total_valid
+        fingerprint, power = self._fingerprint, self._power
+        new = SLLNode if self._pool is None else self._pool.acquire
+        for data in it:
+            last.next = last = new(data)
+            added += 1
+            if numeric:
+                if isinstance(data, (int, float)):
+                    total += data
+                else:
+                    numeric = False
+            if fingerprint is not None:
+                h = _payload_hash(data)
+                if h is None:
+                    fingerprint = None
+                else:
+                    fingerprint = (fingerprint + h * power) % _FP_MOD
+                    power = power * _FP_BASE % _FP_MOD
+
+        if added == 0:
+            return None
+        if self.head is None:
+            self.head = start.next
+        else:
+            self.tail.next = start.next
+        self.tail = last
+        self._size += added
+        self._total = total
+        self._total_valid = numeric
+        self._fingerprint = fingerprint
+        self._power = power
+
+    def extend_list(self, other: SLL) -> None:
+        """
+        Moves every node of `other` to the end of the SLL by relinking `tail`, leaving `other` empty
+        O(1) unless this SLL counts or indexes its values, which costs O(len(other)) to merge
+        :param other: SLL whose nodes are spliced onto this one
+        :return: None
+        """
+        if other is self:
+            raise ValueError("cannot extend an SLL with itself")
+        if other.head is None:
+            return None
+
+        if self._index is not None:
+            curNode, prevNode = other.head, self.tail
+            while curNode is not None:
+                self._index_add(curNode, prevNode)
+                prevNode, curNode = curNode, curNode.next
+        if self._counts is not None:
+            if other._counts is not None:
+                for key, count in other._counts.items():
+                    self._counts[key] = self._counts.get(key, 0) + count
+            else:
+                curNode = other.head
+                while curNode is not None:
+                    key = id(curNode.data)
+                    self._counts[key] = self._counts.get(key, 0) + 1
+                    curNode = curNode.next
+
+        if self._fingerprint is not None and other._fingerprint is not None:
+            self._fingerprint = (self._fingerprint + other._fingerprint * self._power) % _FP_MOD
+            self._power = self._power * other._power % _FP_MOD
+        else:
+            self._fingerprint = None
+
+        if self.head is None:
+            self._total, self._total_valid = other._total, other._total_valid
+            self.head = other.head
+        else:
+            # Only integer totals combine exactly, float totals must keep the in-order summation
+            self._total_valid = (self._total_valid and other._total_valid and
+                                 isinstance(self._total, int) and isinstance(other._total, int))
+            if self._total_valid:
+                self._total += other._total
+            self.tail.next = other.head
+        self.tail = other.tail
+        self._size += other._size
+        other._reset()
+
+    def _reset(self) -> None:
+        """
+        Empties the SLL without touching its former nodes, keeping its counting and index options
+        :return: None
+        """
+        self.head = None
+        self.tail = None
+        self._size = 0
+        self._total = 0
+        self._total_valid = True
+        self._fingerprint = 0
+        self._power = 1
+        if self._counts is not None:
+            self._counts = {}
+        if self._index is not None:
+            self._index = {}
+            self._prev = {}
 
     def to_string(self) -> str:
         """
@@ -104,33 +757,171 @@ class SinglyLinkedList:
         """
         if self.head is None:
             return "None"
-        else:
-            curNode = self.head
-            out_str = ""
 
+        parts = []
+        curNode = self.head
+        while curNode is not None:
+            parts.append(str(curNode.data))
+            curNode = curNode.next
+        return " --> ".join(parts)
+
+    def iter_chunks(self, chunk_size: int = 65536) -> Iterator[str]:
+        """
+        Streams the `to_string` representation of the SLL in pieces
+        Each chunk is cut at the first element boundary at or past `chunk_size` characters, so a chunk
+        only exceeds `chunk_size` by at most one element's string
+        :param chunk_size: target number of characters per chunk
+        :return: generator of chunks whose concatenation equals `to_string()`
+        """
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be positive")
+        if self.head is None:
+            yield "None"
+            return
+
+        parts = []
+        pending = 0
+        curNode = self.head
         while curNode is not None:
-            out_str += str(curNode.data)
+            piece = str(curNode.data)
             if curNode.next is not None:
-                out_str += " --> "
+                piece += " --> "
+            parts.append(piece)
+            pending += len(piece)
+            if pending >= chunk_size:
+                yield "".join(parts)
+                parts.clear()
+                pending = 0
+            curNode = curNode.next
+        if parts:
+            yield "".join(parts)
+
+    def write_to(self, fp: TextIO, chunk_size: int = 65536) -> int:
+        """
+        Writes the `to_string` representation of the SLL to a text stream without building it in memory
+        :param fp: writable text stream
+        :param chunk_size: target number of characters per write, see `iter_chunks`
+        :return: number of characters written
+        """
+        written = 0
+        for chunk in self.iter_chunks(chunk_size):
+            fp.write(chunk)
+            written += len(chunk)
+        return written
+
+    def save(self, path: str) -> None:
+        """
+        Writes the SLL to a binary file
+        Lists of only ints that fit in 64 bits, or of only floats, are stored as one packed array;
+        anything else is stored as length-prefixed pickles
+        The file is written beside `path` and then moved over it, so a list lazily loaded from `path`
+        keeps reading its undecoded nodes from the old file. An existing file keeps its permissions
+        :param path: file to write
+        :return: None
+        """
+        kind = _KIND_INT
+        curNode = self.head
+        while curNode is not None and kind != _KIND_PICKLE:
+            if type(curNode.data) is int and kind == _KIND_INT:
+                if not -(1 << 63) <= curNode.data < (1 << 63):
+                    kind = _KIND_PICKLE
+            elif type(curNode.data) is float and (kind == _KIND_FLOAT or curNode is self.head):
+                kind = _KIND_FLOAT
+            else:
+                kind = _KIND_PICKLE
             curNode = curNode.next
-        return out_str
 
+        descriptor, temp_path = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(path)))
+        try:
+            with os.fdopen(descriptor, 'wb') as fp:
+                fp.write(bytes(_FILE_HEADER.size))
+                count = last = 0
+                if kind == _KIND_PICKLE:
+                    offset = _FILE_HEADER.size
+                    for data in self:
+                        record = pickle.dumps(data, pickle.HIGHEST_PROTOCOL)
+                        fp.write(_RECORD_LENGTH.pack(len(record)))
+                        fp.write(record)
+                        last = offset
+                        offset += _RECORD_LENGTH.size + len(record)
+                        count += 1
+                else:
+                    chunk = array(chr(kind))
+                    for data in self:
+                        chunk.append(data)
+                        if len(chunk) == 65536:
+                            chunk.tofile(fp)
+                            count += len(chunk)
+                            del chunk[:]
+                    chunk.tofile(fp)
+                    count += len(chunk)
+                fp.seek(0)
+                fp.write(_FILE_HEADER.pack(_FILE_MAGIC, kind, sys.byteorder == 'little', count, last))
+            # mkstemp creates the file as 0600, so give it the permissions a plain open() would have
+            try:
+                mode = os.stat(path).st_mode & 0o7777
+            except FileNotFoundError:
+                umask = os.umask(0)
+                os.umask(umask)
+                mode = 0o666 & ~umask
+            os.chmod(temp_path, mode)
+            os.replace(temp_path, path)
+        except BaseException:
+            os.unlink(temp_path)
+            raise
+
+    @classmethod
+    def load(cls, path: str, mmap: bool = True) -> SLL:
+        """
+        Reads an SLL written by `save`
+        :param path: file to read
+        :param mmap: if True, map the file and only decode each node the first time it is traversed,
+        else decode every node up front
+        :return: new SLL holding the saved payloads
+        """
+        with open(path, 'rb') as fp:
+            header = fp.read(_FILE_HEADER.size)
+            if len(header) != _FILE_HEADER.size or header[:4] != _FILE_MAGIC:
+                raise ValueError(f"{path} is not a saved SLL")
+            _, kind, little, count, last = _FILE_HEADER.unpack(header)
+            native = little == (sys.byteorder == 'little')
+
+            if count == 0 or not mmap or not native:
+                if kind == _KIND_PICKLE:
+                    payloads = []
+                    for _ in range(count):
+                        length, = _RECORD_LENGTH.unpack(fp.read(_RECORD_LENGTH.size))
+                        payloads.append(pickle.loads(fp.read(length)))
+                else:
+                    payloads = array(chr(kind))
+                    payloads.fromfile(fp, count)
+                    if not native:
+                        payloads.byteswap()
+                return cls.from_iterable(payloads)
+
+            source = _MappedSource(memory_map(fp.fileno(), 0, access=ACCESS_READ), kind, count)
+
+        sll = cls()
+        if source.values is not None:
+            tailData = source.values[count - 1]
+        else:
+            tailData = source.decode(last)[0]
+        source.tail = sll.tail = SLLNode(tailData)
+        sll.head = source.materialize(_Pending(source, 0, _FILE_HEADER.size))
+        sll._size = count
+        if kind == _KIND_INT:
+            sll._total = sum(source.values)
+        else:
+            sll._total_valid = False
+        sll._fingerprint = None
+        return sll
 
     def length(self) -> int:
         """
         Determines number of nodes in the list
         :return: number of nodes in list
         """
-        if self.head is None:
-            return 0
-        else:
-            curNode = self.head
-            count = 0
-
-        while curNode is not None:
-            count += 1
-            curNode = curNode.next
-        return count
+        return self._size
 
     def total(self) -> T:
         """
@@ -139,13 +930,19 @@ class SinglyLinkedList:
         """
         if self.head is None:
             return None
-        else:
-            curNode = self.head
-            sum = type(curNode.data)()
+        if self._total_valid:
+            return self._total
 
+        curNode = self.head
+        sum = type(curNode.data)()
+        numeric = True
         while curNode is not None:
             sum += curNode.data
+            numeric = numeric and isinstance(curNode.data, (int, float))
             curNode = curNode.next
+        if numeric:
+            self._total = sum
+            self._total_valid = True
         return sum
 
     def delete(self, data: T) -> bool:
@@ -156,6 +953,8 @@ class SinglyLinkedList:
         """
         if self.head is None:
             return False
+        if self._index is not None:
+            return self._indexed_delete(data, False)
         else:
             curNode = self.head
             prevNode = None
@@ -163,16 +962,14 @@ class SinglyLinkedList:
 
         while curNode is not None:
             if curNode.data is data:
+                self._track_remove(data)
                 if prevNode is None:
                     self.head = sucNode
-                    if sucNode is None:
-                        self.tail = None
-                    return True
+                else:
+                    prevNode.next = sucNode
                 if sucNode is None:
                     self.tail = prevNode
-                    self.tail.next = None
-                    return True
-                prevNode.next = sucNode
+                self._release(curNode)
                 return True
             prevNode = curNode
             curNode = sucNode
@@ -188,55 +985,298 @@ class SinglyLinkedList:
         :param data: data to remove
         :return: True if a node was removed, else False
         """
-        delete = False
+        removed = 0
         if self.head is None:
-            return delete
+            return False
+        if self._index is not None:
+            return self._indexed_delete(data, True)
 
         while self.head.data is data:
-            self.head = self.head.next
-            delete = True
+            oldHead = self.head
+            self.head = oldHead.next
+            self._release(oldHead)
+            removed += 1
             if self.head is None:
                 self.tail = None
-                return delete
-
-        curNode = self.head
-        prevNode = None
-        sucNode = curNode.next
+                self._track_remove(data, removed)
+                return True
 
+        prevNode = self.head
+        curNode = prevNode.next
         while curNode is not None:
+            sucNode = curNode.next
             if curNode.data is data:
-                if sucNode is None:
-                    self.tail = prevNode
-                    self.tail.next = None
-                    delete = True
                 prevNode.next = sucNode
-                delete = True
-            prevNode = curNode
+                self._release(curNode)
+                removed += 1
+            else:
+                prevNode = curNode
             curNode = sucNode
-            if sucNode is None:
-                return delete
-            sucNode = sucNode.next
-        return delete
+        self.tail = prevNode
 
+        if removed:
+            self._track_remove(data, removed)
+        return removed > 0
 
-    def find(self, data: T) -> bool:
+
+    def delete_many(self, values: Iterable[T]) -> int:
         """
-        Looks through the SLL for a node containing `data`
-        :param data: data to search for
-        :return: True if found, else False
+        Deletes every node containing any of `values` from the SLL in a single traversal
+        Membership is by identity, like `delete_all`, checked against a hash set of ids
+        :param values: data to remove
+        :return: number of nodes removed
         """
-        if self.head is None:
-            return False
+        # Hold the values so their ids stay valid while we compare against them
+        values = list(values)
+        if self._index is not None:
+            removed = 0
+            for data in values:
+                occurrences = self._index.get(id(data))
+                if occurrences is not None:
+                    removed += len(occurrences)
+                    self._indexed_delete(data, True)
+            return removed
 
-        curNode = self.head
+        targets = {id(data) for data in values}
+        return self._unlink_where(lambda data: id(data) in targets)
 
-        while curNode is not None:
-            if curNode.data is data:
-                return True
-            curNode = curNode.next
-        return False
+    def remove_if(self, predicate: Callable[[T], bool]) -> int:
+        """
+        Deletes every node whose data satisfies `predicate` from the SLL in a single traversal
+        :param predicate: called once per node with its data, True means remove
+        :return: number of nodes removed
+        """
+        removed = self._unlink_where(predicate)
+        if removed and self._index is not None:
+            self._reindex()
+        return removed
 
-    def find_sum(self, data: T) -> int:
+    def _unlink_where(self, match: Callable[[T], bool]) -> int:
+        """
+        Unlinks every node whose data satisfies `match`, keeping `tail` and the aggregates correct
+        Does not repair the value index
+        :param match: called once per node with its data, True means unlink
+        :return: number of nodes unlinked
+        """
+        removed = 0
+        prevNode = None
+        curNode = self.head
+        while curNode is not None:
+            sucNode = curNode.next
+            if match(curNode.data):
+                if prevNode is None:
+                    self.head = sucNode
+                else:
+                    prevNode.next = sucNode
+                self._track_remove(curNode.data)
+                self._release(curNode)
+                removed += 1
+            else:
+                prevNode = curNode
+            curNode = sucNode
+        self.tail = prevNode
+        return removed
+
+    def sort(self, *, comparator: Callable[[T, T], bool] = lambda x, y: x < y, descending: bool = False) -> None:
+        """
+        Sorts the SLL in place with a stable bottom-up merge sort that only relinks `next` references
+        O(n log n) time and O(1) extra space
+        :param comparator: A function which takes two arguments of type T and returns True when the first argument
+        should be treated as less than the second argument.
+        :param descending: Perform the sort in descending order when this is True. Defaults to False.
+        :return: None
+        """
+        if self.head is None or self.head.next is None:
+            return None
+        before = _ordering(comparator, descending)
+
+        width = 1
+        while True:
+            merges = 0
+            head = tail = None
+            left = self.head
+            while left is not None:
+                right = _cut_after(left, width)
+                rest = _cut_after(right, width)
+                runHead, runTail = _merge_runs(left, right, before)
+                if tail is None:
+                    head = runHead
+                else:
+                    tail.next = runHead
+                tail = runTail
+                merges += 1
+                left = rest
+            self.head, self.tail = head, tail
+            if merges <= 1:
+                break
+            width *= 2
+
+        # A float total depends on summation order, so it is recomputed on demand
+        if not isinstance(self._total, int):
+            self._total_valid = False
+        self._fingerprint = None
+        if self._index is not None:
+            self._reindex()
+
+    def merge_sorted(self, other: SLL, *, comparator: Callable[[T, T], bool] = lambda x, y: x < y,
+                     descending: bool = False) -> None:
+        """
+        Merges the nodes of `other` into the SLL in linear time without allocating nodes, leaving `other` empty
+        Both lists must already be sorted by `comparator`/`descending`; on ties nodes of this SLL come first
+        :param other: sorted SLL whose nodes are merged in
+        :param comparator: A function which takes two arguments of type T and returns True when the first argument
+        should be treated as less than the second argument.
+        :param descending: Whether both lists are sorted in descending order. Defaults to False.
+        :return: None
+        """
+        if other is self:
+            raise ValueError("cannot merge an SLL with itself")
+        if other.head is None:
+            return None
+
+        # Splice for the aggregates, then re-merge the two runs that now sit back to back
+        boundary = self.tail
+        self.extend_list(other)
+        if boundary is None:
+            return None
+        right = boundary.next
+        boundary.next = None
+        self.head, self.tail = _merge_runs(self.head, right, _ordering(comparator, descending))
+        if not isinstance(self._total, int):
+            self._total_valid = False
+        self._fingerprint = None
+        if self._index is not None:
+            self._reindex()
+
+    def _find_node(self, data: T) -> Tuple[Node, Node]:
+        """
+        Locates the first node containing `data` along with its predecessor
+        :param data: data to search for
+        :return: (predecessor, node), with predecessor None for the head and (None, None) if not found
+        """
+        if self._index is not None:
+            occurrences = self._index.get(id(data))
+            if occurrences is None:
+                return None, None
+            return self._prev[id(occurrences[0])], occurrences[0]
+
+        prevNode = None
+        curNode = self.head
+        while curNode is not None:
+            if curNode.data is data:
+                return prevNode, curNode
+            prevNode, curNode = curNode, curNode.next
+        return None, None
+
+    def _find_prev(self, node: Node) -> Node:
+        """
+        Locates the predecessor of a node in the SLL
+        :param node: node whose predecessor is wanted, must not be the head
+        :return: predecessor of `node`
+        """
+        if self._index is not None:
+            return self._prev[id(node)]
+        prevNode = self.head
+        while prevNode is not None and prevNode.next is not node:
+            prevNode = prevNode.next
+        if prevNode is None:
+            raise ValueError("node is not in this SLL")
+        return prevNode
+
+    def rotate_to(self, node: Node, prev: Node = None) -> None:
+        """
+        Rotates the SLL in place so `node` becomes the head, preserving the cyclic order of nodes
+        Only relinks existing nodes: O(1) given `prev`, plus O(nodes before `node`) in indexed mode
+        :param node: node in this SLL that should become the head
+        :param prev: predecessor of `node`, looked up (O(n) unless indexed) if not given
+        :return: None
+        """
+        if node is self.head:
+            return None
+        if prev is None:
+            prev = self._find_prev(node)
+        elif prev.next is not node:
+            raise ValueError("prev must directly precede node")
+
+        if self._index is not None:
+            # Every node ahead of `node` becomes the last occurrence of its data, in order
+            curNode = self.head
+            while curNode is not node:
+                self._index[id(curNode.data)].rotate(-1)
+                curNode = curNode.next
+            self._prev[id(self.head)] = self.tail
+            self._prev[id(node)] = None
+
+        self.tail.next = self.head
+        self.head = node
+        self.tail = prev
+        prev.next = None
+        self._fingerprint = None
+
+    def splice(self, prev: Node, node: Node) -> None:
+        """
+        Moves `node` to the front of the SLL by relinking it, without touching any other node's order
+        O(1), plus O(occurrences of `node.data`) in indexed mode
+        :param prev: predecessor of `node`, None if `node` is already the head
+        :param node: node in this SLL to move to the front
+        :return: None
+        """
+        if prev is None:
+            if node is not self.head:
+                raise ValueError("prev must directly precede node")
+            return None
+        if prev.next is not node:
+            raise ValueError("prev must directly precede node")
+
+        if self._index is not None:
+            occurrences = self._index[id(node.data)]
+            occurrences.remove(node)
+            occurrences.appendleft(node)
+            if node.next is not None:
+                self._prev[id(node.next)] = prev
+            self._prev[id(self.head)] = node
+            self._prev[id(node)] = None
+
+        prev.next = node.next
+        if node is self.tail:
+            self.tail = prev
+        node.next = self.head
+        self.head = node
+        self._fingerprint = None
+
+    def _reindex(self) -> None:
+        """
+        Rebuilds the value index and predecessor map from the current chain
+        :return: None
+        """
+        self._index = {}
+        self._prev = {}
+        prevNode = None
+        curNode = self.head
+        while curNode is not None:
+            self._index_add(curNode, prevNode)
+            prevNode, curNode = curNode, curNode.next
+
+    def find(self, data: T) -> bool:
+        """
+        Looks through the SLL for a node containing `data`
+        :param data: data to search for
+        :return: True if found, else False
+        """
+        if self.head is None:
+            return False
+        if self._index is not None:
+            return id(data) in self._index
+
+        curNode = self.head
+
+        while curNode is not None:
+            if curNode.data is data:
+                return True
+            curNode = curNode.next
+        return False
+
+    def find_sum(self, data: T) -> int:
         """
         Returns the number of occurrences of `data` in this list
         :param data: data to find and sum up
@@ -246,14 +1286,814 @@ class SinglyLinkedList:
 
         if self.head is None:
             return False
+        if self._counts is not None:
+            return self._counts.get(id(data), 0)
+        if self._index is not None:
+            occurrences = self._index.get(id(data))
+            return len(occurrences) if occurrences is not None else 0
+
+        curNode = self.head
+        while curNode is not None:
+            if curNode.data is data:
+                sum += 1
+            curNode = curNode.next
+        return sum
+
+
+class CompactSinglyLinkedList:
+    """
+    SLL implementation that stores payloads and `next` links in parallel arrays instead of SLLNodes
+    Links are slot indices in an `array('q')` (-1 stands in for None) and deleted slots are kept on
+    a free list, chained through the same link array, for reuse by later appends
+    """
+
+    __slots__ = ['_data', '_next', '_head', '_tail', '_free', '_size']
+
+    def __init__(self) -> None:
+        """
+        Initializes an empty compact SLL
+        :return: None
+        """
+        self._data = []
+        self._next = array('q')
+        self._head = -1
+        self._tail = -1
+        self._free = -1
+        self._size = 0
+
+    def __repr__(self) -> str:
+        """
+        Represents a compact SLL as a string
+        :return: string representation of the compact SLL
+        """
+        return self.to_string()
+
+    def _release(self, slot: int) -> None:
+        """
+        Pushes an unlinked slot onto the free list and drops its payload reference
+        :param slot: index of the slot to release
+        :return: None
+        """
+        self._data[slot] = None
+        self._next[slot] = self._free
+        self._free = slot
+        self._size -= 1
+
+    def append(self, data: T) -> None:
+        """
+        Append `data` to the end of the compact SLL, reusing a free slot when one is available
+        :param data: data to append
+        :return: None
+        """
+        slot = self._free
+        if slot == -1:
+            slot = len(self._data)
+            self._data.append(data)
+            self._next.append(-1)
+        else:
+            self._free = self._next[slot]
+            self._data[slot] = data
+            self._next[slot] = -1
+
+        if self._head == -1:
+            self._head = slot
+        else:
+            self._next[self._tail] = slot
+        self._tail = slot
+        self._size += 1
+
+    def to_string(self) -> str:
+        """
+        Converts a compact SLL to a string
+        :return: string representation of the compact SLL
+        """
+        if self._head == -1:
+            return "None"
+        data, links = self._data, self._next
+        parts = []
+        slot = self._head
+        while slot != -1:
+            parts.append(str(data[slot]))
+            slot = links[slot]
+        return " --> ".join(parts)
+
+    def length(self) -> int:
+        """
+        Determines number of elements in the list
+        :return: number of elements in list
+        """
+        return self._size
+
+    def total(self) -> T:
+        """
+        Sums up the values in the list
+        :return: total sum of values in the list
+        """
+        if self._head == -1:
+            return None
+        data, links = self._data, self._next
+        slot = self._head
+        sum = type(data[slot])()
+        while slot != -1:
+            sum += data[slot]
+            slot = links[slot]
+        return sum
+
+    def delete(self, data: T) -> bool:
+        """
+        Deletes the first element that is `data` from the compact SLL
+        :param data: data to remove
+        :return: True if an element was removed, else False
+        """
+        payloads, links = self._data, self._next
+        prev = -1
+        slot = self._head
+        while slot != -1:
+            if payloads[slot] is data:
+                sucSlot = links[slot]
+                if prev == -1:
+                    self._head = sucSlot
+                else:
+                    links[prev] = sucSlot
+                if sucSlot == -1:
+                    self._tail = prev
+                self._release(slot)
+                return True
+            prev = slot
+            slot = links[slot]
+        return False
+
+    def delete_all(self, data: T) -> bool:
+        """
+        Deletes all elements that are `data` from the compact SLL
+        :param data: data to remove
+        :return: True if an element was removed, else False
+        """
+        payloads, links = self._data, self._next
+        removed = False
+        prev = -1
+        slot = self._head
+        while slot != -1:
+            sucSlot = links[slot]
+            if payloads[slot] is data:
+                if prev == -1:
+                    self._head = sucSlot
+                else:
+                    links[prev] = sucSlot
+                self._release(slot)
+                removed = True
+            else:
+                prev = slot
+            slot = sucSlot
+        self._tail = prev
+        return removed
+
+    def find(self, data: T) -> bool:
+        """
+        Looks through the compact SLL for an element that is `data`
+        :param data: data to search for
+        :return: True if found, else False
+        """
+        payloads, links = self._data, self._next
+        slot = self._head
+        while slot != -1:
+            if payloads[slot] is data:
+                return True
+            slot = links[slot]
+        return False
+
+    def find_sum(self, data: T) -> int:
+        """
+        Returns the number of occurrences of `data` in this list
+        :param data: data to find and sum up
+        :return: number of times the data occurred
+        """
+        if self._head == -1:
+            return False
+        payloads, links = self._data, self._next
+        sum = 0
+        slot = self._head
+        while slot != -1:
+            if payloads[slot] is data:
+                sum += 1
+            slot = links[slot]
+        return sum
+
+
+class UnrolledNode:
+    """
+    Node of an unrolled SLL, holding up to a fixed number of payloads in order
+    """
+
+    __slots__ = ['items', 'next']
+
+    def __init__(self, items: List[T], next: Node = None) -> None:
+        """
+        Initialize an unrolled node
+        :param items: payloads held by the node, in list order
+        :param next: reference to the next node in the SLL
+        :return: None
+        """
+        self.items = items
+        self.next = next
+
+    def __repr__(self) -> str:
+        """
+        Overloads `repr()` method for use in debugging
+        :return: string representation of node
+        """
+        return '(Node: ' + str(self.items) + ' )'
+
+    __str__ = __repr__
+
+
+class UnrolledSinglyLinkedList:
+    """
+    SLL implementation whose nodes each hold up to `capacity` payloads
+    Observable ordering and the identity (`is`) semantics of `find`/`delete` match SinglyLinkedList,
+    while scans chase one pointer per node instead of one per payload
+    """
+
+    __slots__ = ['head', 'tail', 'capacity', '_size']
+
+    def __init__(self, capacity: int = 64) -> None:
+        """
+        Initializes an empty unrolled SLL
+        :param capacity: maximum number of payloads per node
+        :return: None
+        """
+        if capacity < 1:
+            raise ValueError("capacity must be positive")
+        self.head = None
+        self.tail = None
+        self.capacity = capacity
+        self._size = 0
+
+    def __repr__(self) -> str:
+        """
+        Represents an unrolled SLL as a string
+        :return: string representation of the unrolled SLL
+        """
+        return self.to_string()
+
+    def __iter__(self) -> Iterator[T]:
+        """
+        Lazily yields each payload from head to tail
+        :return: generator of data
+        """
+        curNode = self.head
+        while curNode is not None:
+            yield from curNode.items
+            curNode = curNode.next
+
+    def append(self, data: T) -> None:
+        """
+        Append `data` to the end of the unrolled SLL, opening a new node when the tail is full
+        :param data: data to append
+        :return: None
+        """
+        if self.tail is None:
+            self.head = self.tail = UnrolledNode([data])
+        elif len(self.tail.items) < self.capacity:
+            self.tail.items.append(data)
+        else:
+            self.tail.next = UnrolledNode([data])
+            self.tail = self.tail.next
+        self._size += 1
+
+    def to_string(self) -> str:
+        """
+        Converts an unrolled SLL to a string
+        :return: string representation of the unrolled SLL
+        """
+        if self.head is None:
+            return "None"
+        return " --> ".join(map(str, self))
+
+    def length(self) -> int:
+        """
+        Determines number of payloads in the list
+        :return: number of payloads in list
+        """
+        return self._size
+
+    def total(self) -> T:
+        """
+        Sums up the values in the list
+        :return: total sum of values in the list
+        """
+        if self.head is None:
+            return None
+        sum = type(self.head.items[0])()
+        curNode = self.head
+        while curNode is not None:
+            for data in curNode.items:
+                sum += data
+            curNode = curNode.next
+        return sum
+
+    def _unlink(self, prevNode: UnrolledNode, curNode: UnrolledNode) -> None:
+        """
+        Unlinks an emptied node, or folds its successor into it when both fit in one node
+        :param prevNode: predecessor of `curNode`, None if `curNode` is the head
+        :param curNode: node that just lost payloads
+        :return: None
+        """
+        sucNode = curNode.next
+        if not curNode.items:
+            if prevNode is None:
+                self.head = sucNode
+            else:
+                prevNode.next = sucNode
+            if sucNode is None:
+                self.tail = prevNode
+        elif (sucNode is not None and len(curNode.items) < self.capacity // 2 and
+              len(curNode.items) + len(sucNode.items) <= self.capacity):
+            curNode.items.extend(sucNode.items)
+            curNode.next = sucNode.next
+            if sucNode is self.tail:
+                self.tail = curNode
+
+    def delete(self, data: T) -> bool:
+        """
+        Deletes the first payload that is `data` from the unrolled SLL
+        :param data: data to remove
+        :return: True if a payload was removed, else False
+        """
+        prevNode = None
+        curNode = self.head
+        while curNode is not None:
+            items = curNode.items
+            # Identity tests mapped in C reject most nodes without a Python loop, and never call `__eq__`
+            if any(map(is_, items, repeat(data))):
+                for i, item in enumerate(items):
+                    if item is data:
+                        del items[i]
+                        self._size -= 1
+                        self._unlink(prevNode, curNode)
+                        return True
+            prevNode, curNode = curNode, curNode.next
+        return False
+
+    def delete_all(self, data: T) -> bool:
+        """
+        Deletes all payloads that are `data` from the unrolled SLL
+        :param data: data to remove
+        :return: True if a payload was removed, else False
+        """
+        removed = 0
+        prevNode = None
+        curNode = self.head
+        while curNode is not None:
+            sucNode = curNode.next
+            if any(map(is_, curNode.items, repeat(data))):
+                kept = [item for item in curNode.items if item is not data]
+                removed += len(curNode.items) - len(kept)
+                curNode.items = kept
+                if not kept:
+                    self._unlink(prevNode, curNode)
+                    curNode = sucNode
+                    continue
+            prevNode, curNode = curNode, sucNode
+        self._size -= removed
+        return removed > 0
+
+    def find(self, data: T) -> bool:
+        """
+        Looks through the unrolled SLL for a payload that is `data`
+        :param data: data to search for
+        :return: True if found, else False
+        """
+        curNode = self.head
+        while curNode is not None:
+            if any(map(is_, curNode.items, repeat(data))):
+                return True
+            curNode = curNode.next
+        return False
+
+    def find_sum(self, data: T) -> int:
+        """
+        Returns the number of occurrences of `data` in this list
+        :param data: data to find and sum up
+        :return: number of times the data occurred
+        """
+        if self.head is None:
+            return False
+        sum = 0
+        curNode = self.head
+        while curNode is not None:
+            sum += list(map(is_, curNode.items, repeat(data))).count(True)
+            curNode = curNode.next
+        return sum
+
+
+class _Lane:
+    """
+    Express-lane entry of a SortedLinkedList, skipping ahead over the SLLNode chain
+    """
 
+    __slots__ = ['node', 'next', 'down']
+
+    def __init__(self, node: SLLNode, next: '_Lane' = None, down: '_Lane' = None) -> None:
+        """
+        Initialize an express-lane entry
+        :param node: SLLNode this entry stands for, None for the sentinel in front of the head
+        :param next: next entry on the same lane
+        :param down: entry for the same node one lane below, None on the lowest lane
+        :return: None
+        """
+        self.node = node
+        self.next = next
+        self.down = down
+
+
+class SortedLinkedList:
+    """
+    SLL kept in sorted order, with probabilistic express lanes (a skip list) over its SLLNode chain
+    `find`, `insert` and `delete` take O(log n) expected time; the chain itself reads like any SLL
+    """
+
+    __slots__ = ['head', 'tail', '_lanes', '_before', '_random', '_size']
+
+    MAX_LANES = 32
+
+    def __init__(self, *, comparator: Callable[[T, T], bool] = lambda x, y: x < y, descending: bool = False,
+                 seed: int = None) -> None:
+        """
+        Initializes an empty sorted SLL
+        :param comparator: A function which takes two arguments of type T and returns True when the first argument
+        should be treated as less than the second argument.
+        :param descending: Keep the list in descending order when this is True. Defaults to False.
+        :param seed: seed for the coin flips that build the express lanes
+        :return: None
+        """
+        self.head = None
+        self.tail = None
+        # _lanes[i] is the sentinel of lane i + 1; lane 0 is the SLLNode chain itself
+        self._lanes = []
+        self._before = _ordering(comparator, descending)
+        self._random = Random(seed)
+        self._size = 0
+
+    def __repr__(self) -> str:
+        """
+        Represents a sorted SLL as a string
+        :return: string representation of the sorted SLL
+        """
+        return self.to_string()
+
+    def __iter__(self) -> Iterator[T]:
+        """
+        Lazily yields the data of each node in sorted order
+        :return: generator of data
+        """
         curNode = self.head
         while curNode is not None:
+            yield curNode.data
+            curNode = curNode.next
+
+    def _descend(self, data: T, inclusive: bool) -> Tuple[List[_Lane], SLLNode]:
+        """
+        Walks the express lanes down to the chain, stopping before nodes that do not come before `data`
+        :param data: data to position
+        :param inclusive: if True also pass over nodes equal to `data`, else stop at the first of them
+        :return: (last entry visited on each lane, lowest lane first; last chain node passed, None for none)
+        """
+        before = self._before
+        path = [None] * len(self._lanes)
+        entry = self._lanes[-1] if self._lanes else None
+        for level in range(len(self._lanes) - 1, -1, -1):
+            nxt = entry.next
+            while nxt is not None and (not before(data, nxt.node.data) if inclusive else before(nxt.node.data, data)):
+                entry, nxt = nxt, nxt.next
+            path[level] = entry
+            if level:
+                entry = entry.down
+
+        prevNode = path[0].node if path else None
+        curNode = self.head if prevNode is None else prevNode.next
+        while curNode is not None and (not before(data, curNode.data) if inclusive else before(curNode.data, data)):
+            prevNode, curNode = curNode, curNode.next
+        return path, prevNode
+
+    def insert(self, data: T) -> None:
+        """
+        Inserts `data` in sorted order, after any equal data already in the list
+        :param data: data to insert
+        :return: None
+        """
+        path, prevNode = self._descend(data, True)
+        if prevNode is None:
+            newNode = SLLNode(data, self.head)
+            self.head = newNode
+        else:
+            newNode = SLLNode(data, prevNode.next)
+            prevNode.next = newNode
+        if newNode.next is None:
+            self.tail = newNode
+        self._size += 1
+
+        below = None
+        level = 0
+        while self._random.random() < 0.5 and level < self.MAX_LANES:
+            if level == len(self._lanes):
+                self._lanes.append(_Lane(None, None, self._lanes[-1] if self._lanes else None))
+                path.append(self._lanes[-1])
+            entry = path[level]
+            below = entry.next = _Lane(newNode, entry.next, below)
+            level += 1
+
+    def _locate(self, data: T) -> Tuple[List[_Lane], SLLNode, SLLNode]:
+        """
+        Finds the first node that is `data` within the run of nodes equal to `data`
+        :param data: data to search for
+        :return: (lane path to the start of the run, predecessor, node), node is None if not found
+        """
+        path, prevNode = self._descend(data, False)
+        curNode = self.head if prevNode is None else prevNode.next
+        while curNode is not None and not self._before(data, curNode.data):
+            if curNode.data is data:
+                return path, prevNode, curNode
+            prevNode, curNode = curNode, curNode.next
+        return path, None, None
+
+    def find(self, data: T) -> bool:
+        """
+        Looks through the sorted SLL for a node containing `data`
+        :param data: data to search for
+        :return: True if found, else False
+        """
+        return self._locate(data)[2] is not None
+
+    def find_sum(self, data: T) -> int:
+        """
+        Returns the number of occurrences of `data` in this list
+        :param data: data to find and sum up
+        :return: number of times the data occurred
+        """
+        if self.head is None:
+            return False
+        _, prevNode = self._descend(data, False)
+        curNode = self.head if prevNode is None else prevNode.next
+        sum = 0
+        while curNode is not None and not self._before(data, curNode.data):
             if curNode.data is data:
                 sum += 1
             curNode = curNode.next
         return sum
 
+    def delete(self, data: T) -> bool:
+        """
+        Deletes the first node containing `data` from the sorted SLL
+        :param data: data to remove
+        :return: True if a node was removed, else False
+        """
+        path, prevNode, target = self._locate(data)
+        if target is None:
+            return False
+
+        for entry in path:
+            # Entries for equal data ahead of `target` may sit between the path and `target`'s entry
+            while entry.next is not None and entry.next.node is not target and \
+                    not self._before(data, entry.next.node.data):
+                entry = entry.next
+            if entry.next is None or entry.next.node is not target:
+                break
+            entry.next = entry.next.next
+        while self._lanes and self._lanes[-1].next is None:
+            self._lanes.pop()
+
+        if prevNode is None:
+            self.head = target.next
+        else:
+            prevNode.next = target.next
+        if target.next is None:
+            self.tail = prevNode
+        target.next = None
+        self._size -= 1
+        return True
+
+    def to_string(self) -> str:
+        """
+        Converts a sorted SLL to a string
+        :return: string representation of the sorted SLL
+        """
+        if self.head is None:
+            return "None"
+        return " --> ".join(map(str, self))
+
+    def length(self) -> int:
+        """
+        Determines number of nodes in the list
+        :return: number of nodes in list
+        """
+        return self._size
+
+    def total(self) -> T:
+        """
+        Sums up the values in the list
+        :return: total sum of values in the list
+        """
+        if self.head is None:
+            return None
+        sum = type(self.head.data)()
+        curNode = self.head
+        while curNode is not None:
+            sum += curNode.data
+            curNode = curNode.next
+        return sum
+
+
+class LockedSLLNode(SLLNode):
+    """
+    SLLNode carrying its own lock, for hand-over-hand traversal in ConcurrentSinglyLinkedList
+    """
+
+    __slots__ = ['lock']
+
+    def __init__(self, data: T, next: Node = None) -> None:
+        """
+        Initialize a locked SLL Node
+        :param data: data value held by the node
+        :param next: reference to the next node in the SLL
+        :return: None
+        """
+        super().__init__(data, next)
+        self.lock = Lock()
+
+
+class ConcurrentSinglyLinkedList:
+    """
+    SLL that several threads may append to and delete from at once
+    Appends only lock the current tail node, deletes lock nodes hand-over-hand, and readers copy a
+    snapshot by locking every node hand-over-hand, which briefly holds writers off
+    """
+
+    __slots__ = ['_head', '_tail', '_appended', '_removed', '_removed_lock']
+
+    def __init__(self) -> None:
+        """
+        Initializes an empty concurrent SLL
+        :return: None
+        """
+        # The sentinel in front of the first node gives every deletion a predecessor to lock
+        self._head = LockedSLLNode(None)
+        self._tail = self._head
+        # Appends are serialized by the tail lock, so only deletes need a lock for their count
+        self._appended = 0
+        self._removed = 0
+        self._removed_lock = Lock()
+
+    @property
+    def head(self) -> LockedSLLNode:
+        """
+        First node of the SLL
+        :return: first node, None if the SLL is empty
+        """
+        return self._head.next
+
+    @property
+    def tail(self) -> LockedSLLNode:
+        """
+        Last node of the SLL
+        :return: last node, None if the SLL is empty
+        """
+        tail = self._tail
+        return None if tail is self._head else tail
+
+    def __repr__(self) -> str:
+        """
+        Represents a concurrent SLL as a string
+        :return: string representation of a snapshot of the SLL
+        """
+        return self.to_string()
+
+    def __iter__(self) -> Iterator[T]:
+        """
+        Iterates over a snapshot of the data, unaffected by later mutations
+        :return: iterator of data
+        """
+        return iter(self.snapshot())
+
+    def snapshot(self) -> List[T]:
+        """
+        Copies the data of every node while no mutation is in progress
+        Nodes are locked hand-over-hand without releasing any, in the same order deletes take them, so
+        once the last node is held no append or delete can change the chain
+        :return: list of data from head to tail
+        """
+        held = [self._head]
+        self._head.lock.acquire()
+        try:
+            curNode = self._head.next
+            while curNode is not None:
+                curNode.lock.acquire()
+                held.append(curNode)
+                curNode = curNode.next
+            return [node.data for node in held[1:]]
+        finally:
+            for node in held:
+                node.lock.release()
+
+    def append(self, data: T) -> None:
+        """
+        Append a node containing `data` to the end of the SLL, locking only the current tail node
+        :param data: data to append
+        :return: None
+        """
+        newNode = LockedSLLNode(data)
+        while True:
+            tail = self._tail
+            with tail.lock:
+                # A delete may have unlinked `tail` while we waited, then try the new tail
+                if self._tail is tail:
+                    tail.next = newNode
+                    # Counted before `tail` moves on, while no other append can get in
+                    self._appended += 1
+                    self._tail = newNode
+                    break
+
+    def _unlink_matching(self, data: T, all: bool) -> int:
+        """
+        Walks the SLL hand-over-hand, unlinking the first (or every) node that is `data`
+        The predecessor and current node are both locked whenever a link is changed, and `tail`
+        only moves while the lock of the node it points at is held
+        :param data: data to remove
+        :param all: if True remove every occurrence, else only the first
+        :return: number of nodes removed
+        """
+        removed = 0
+        prevNode = self._head
+        prevNode.lock.acquire()
+        curNode = prevNode.next
+        while curNode is not None:
+            curNode.lock.acquire()
+            if curNode.data is data:
+                # Removed nodes keep their `next` so lock-free readers can walk past them
+                prevNode.next = curNode.next
+                if self._tail is curNode:
+                    self._tail = prevNode
+                removed += 1
+                curNode.lock.release()
+                if not all:
+                    break
+                curNode = prevNode.next
+            else:
+                prevNode.lock.release()
+                prevNode, curNode = curNode, curNode.next
+        prevNode.lock.release()
+        if removed:
+            with self._removed_lock:
+                self._removed += removed
+        return removed
+
+    def delete(self, data: T) -> bool:
+        """
+        Deletes the first node containing `data` from the SLL
+        :param data: data to remove
+        :return: True if a node was removed, else False
+        """
+        return self._unlink_matching(data, False) > 0
+
+    def delete_all(self, data: T) -> bool:
+        """
+        Deletes all instances of a node containing `data` from the SLL
+        :param data: data to remove
+        :return: True if a node was removed, else False
+        """
+        return self._unlink_matching(data, True) > 0
+
+    def find(self, data: T) -> bool:
+        """
+        Looks through the SLL for a node containing `data` without taking any lock
+        The answer reflects some interleaving of concurrent mutations
+        :param data: data to search for
+        :return: True if found, else False
+        """
+        curNode = self._head.next
+        while curNode is not None:
+            if curNode.data is data:
+                return True
+            curNode = curNode.next
+        return False
+
+    def length(self) -> int:
+        """
+        Determines number of nodes in the list
+        :return: number of nodes in list
+        """
+        return self._appended - self._removed
+
+    def to_string(self) -> str:
+        """
+        Converts a snapshot of the concurrent SLL to a string
+        :return: string representation of the SLL
+        """
+        data = self.snapshot()
+        if not data:
+            return "None"
+        return " --> ".join(map(str, data))
+
 
 def help_mario(roster: SLL, ally: str) -> bool:
     """
@@ -263,14 +2103,48 @@ def help_mario(roster: SLL, ally: str) -> bool:
     :param ally: the racer that needs to go first
     :return: True if the roster was changed, else False
     """
-    if roster.head is None or not roster.find(ally) or roster.head.data is ally:
+    if roster.head is None or roster.head.data is ally:
         return False
 
+    prevRacer, allyRacer = roster._find_node(ally)
+    if allyRacer is None:
+        return False
+    roster.rotate_to(allyRacer, prevRacer)
+    return True
+
+
+def help_mario_batch(roster: SLL, allies: Iterable[str]) -> List[bool]:
+    """
+    Applies `help_mario` for each ally in turn, relinking the roster only once at the end
+    Every rotation preserves the cyclic order of racers, so each query only moves an offset into
+    positions precomputed in a single pass
+    :param roster: initial order of racers
+    :param allies: the racers that need to go first, in order
+    :return: what `help_mario` would have returned for each ally
+    """
+    if roster.head is None:
+        return [False for _ in allies]
+
+    racers = []
+    positions = {}
     curRacer = roster.head
     while curRacer is not None:
-        curRacer = roster.head
-        if curRacer.data is ally:
-            return True
-        else:
-            roster.head = curRacer.next
-            roster.append(curRacer.data)
\ No newline at end of file
+        positions.setdefault(id(curRacer.data), []).append(len(racers))
+        racers.append(curRacer)
+        curRacer = curRacer.next
+
+    results = []
+    offset = 0
+    for ally in allies:
+        occurrences = positions.get(id(ally))
+        if occurrences is None or racers[offset].data is ally:
+            results.append(False)
+            continue
+        # First occurrence of the ally at or after the current head, wrapping around
+        i = bisect_left(occurrences, offset)
+        offset = occurrences[i] if i < len(occurrences) else occurrences[0]
+        results.append(True)
+
+    if offset:
+        roster.rotate_to(racers[offset], racers[offset - 1])
+    return results
@@ -1,8 +1,15 @@
 import unittest
-from solution import SinglyLinkedList as SLL, help_mario, SLLNode
+from solution import SinglyLinkedList as SLL, help_mario, help_mario_batch, SLLNode, SLLNodePool, CompactSinglyLinkedList, \
+    UnrolledSinglyLinkedList, SortedLinkedList, ConcurrentSinglyLinkedList
 from random import seed, randint, shuffle
 from typing import Tuple
 import string
+import io
+import pickle
+import copy
+import threading
+import os
+import tempfile
 
 
 class MyTestCase(unittest.TestCase):
@@ -60,6 +67,101 @@ class MyTestCase(unittest.TestCase):
         self.assertEqual(53.09, sll.tail.data)  # 6
         self.assertIs(sll.head.next.next, sll.tail)  # 6
 
+    def test_bulk_construction(self):
+        # 1. Build from a list, a generator and an empty iterable
+        sll = SLL.from_iterable([4, 2, 0])
+        self.assertEqual("4 --> 2 --> 0", sll.to_string())  # 1
+        self.assertEqual(0, sll.tail.data)  # 1
+        self.assertEqual(3, sll.length())  # 1
+        self.assertEqual(6, sll.total())  # 1
+        sll = SLL.from_iterable(x * x for x in range(4))
+        self.assertEqual("0 --> 1 --> 4 --> 9", sll.to_string())  # 1
+        sll = SLL.from_iterable([])
+        self.assertIs(None, sll.head)  # 1
+        self.assertIs(None, sll.tail)  # 1
+
+        # 2. Extend a non-empty list, keeping the maintained aggregates
+        sll = SLL.from_iterable(['C', 'S'])
+        sll.extend(iter(['E', '331']))
+        self.assertEqual("C --> S --> E --> 331", sll.to_string())  # 2
+        self.assertEqual(4, sll.length())  # 2
+        self.assertEqual('CSE331', sll.total())  # 2
+        self.assertIs(None, sll.tail.next)  # 2
+
+        # 3. Extend counted and indexed lists
+        counted = SLL.from_iterable([1, 2, 1], count_values=True)
+        self.assertEqual(2, counted.find_sum(1))  # 3
+        indexed = SLL.from_iterable([1, 2, 1], indexed=True)
+        self.assertEqual(True, indexed.delete(2))  # 3
+        self.assertEqual("1 --> 1", indexed.to_string())  # 3
+        counted = SLL.from_iterable([1, 2], count_values=True)
+        counted.extend(counted)
+        self.assertEqual("1 --> 2 --> 1 --> 2", counted.to_string())  # 3
+        self.assertEqual(2, counted.find_sum(2))  # 3
+        indexed = SLL.from_iterable([1, 2], indexed=True)
+        indexed.extend(indexed)
+        self.assertEqual("1 --> 2 --> 1 --> 2", indexed.to_string())  # 3
+        self.assertEqual(True, indexed.delete_all(1))  # 3
+        self.assertEqual("2 --> 2", indexed.to_string())  # 3
+
+        # 4. Splice another list in by relinking tail
+        sll = SLL.from_iterable([1, 2])
+        other = SLL.from_iterable([3, 4])
+        tail = other.tail
+        sll.extend_list(other)
+        self.assertEqual("1 --> 2 --> 3 --> 4", sll.to_string())  # 4
+        self.assertIs(tail, sll.tail)  # 4
+        self.assertEqual(4, sll.length())  # 4
+        self.assertEqual(10, sll.total())  # 4
+        self.assertIs(None, other.head)  # 4
+        self.assertEqual(0, other.length())  # 4
+
+        # 5. Splice into an empty, indexed list
+        indexed = SLL(indexed=True)
+        indexed.extend_list(SLL.from_iterable([5, 6, 5]))
+        self.assertEqual(True, indexed.delete_all(5))  # 5
+        self.assertEqual("6", indexed.to_string())  # 5
+        self.assertIs(indexed.head, indexed.tail)  # 5
+        with self.assertRaises(ValueError):
+            indexed.extend_list(indexed)  # 5
+
+    def test_iteration(self):
+        sll = SLL()
+
+        # 1. Iterate an empty list
+        self.assertEqual([], list(sll))  # 1
+        self.assertEqual([], list(sll.iter_nodes()))  # 1
+        self.assertEqual([], list(sll.window(2)))  # 1
+        self.assertEqual([], list(sll.take(3)))  # 1
+
+        sll.extend([4, 2, 0, 7])  # SLL: 4 --> 2 --> 0 --> 7
+
+        # 2. Iterate data and nodes
+        self.assertEqual([4, 2, 0, 7], list(sll))  # 2
+        nodes = list(sll.iter_nodes())
+        self.assertIs(sll.head, nodes[0])  # 2
+        self.assertIs(sll.tail, nodes[-1])  # 2
+
+        # 3. Sliding windows
+        self.assertEqual([(4, 2), (2, 0), (0, 7)], list(sll.window(2)))  # 3
+        self.assertEqual([(4, 2, 0, 7)], list(sll.window(4)))  # 3
+        self.assertEqual([], list(sll.window(5)))  # 3
+        with self.assertRaises(ValueError):
+            list(sll.window(0))  # 3
+
+        # 4. Skip and take
+        self.assertEqual([0, 7], list(sll.skip(2)))  # 4
+        self.assertEqual([], list(sll.skip(10)))  # 4
+        self.assertEqual([4, 2], list(sll.take(2)))  # 4
+        self.assertEqual([4, 2, 0, 7], list(sll.take(10)))  # 4
+        self.assertEqual([2, 0], list(SLL.from_iterable(sll.skip(1)).take(2)))  # 4
+
+        # 5. Nodes may be unlinked while iterating them
+        for node in sll.iter_nodes():
+            if node.data == 2:
+                sll.delete(node.data)
+        self.assertEqual([4, 0, 7], list(sll))  # 5
+
     def test_to_string(self):
         sll = SLL()
 
@@ -91,6 +193,108 @@ class MyTestCase(unittest.TestCase):
         sll.append('1')
         self.assertEqual("C --> S --> E --> 3 --> 3 --> 1", sll.to_string())  # 7
 
+    def test_iter_chunks(self):
+        sll = SLL()
+
+        # 1. Stream an empty list
+        self.assertEqual(["None"], list(sll.iter_chunks()))  # 1
+        out = io.StringIO()
+        self.assertEqual(4, sll.write_to(out))  # 1
+        self.assertEqual("None", out.getvalue())  # 1
+
+        for value in range(100):
+            sll.append(value)
+
+        # 2. Chunks join back into to_string and are bounded by one element past chunk_size
+        chunks = list(sll.iter_chunks(chunk_size=16))
+        self.assertEqual(sll.to_string(), "".join(chunks))  # 2
+        self.assertTrue(len(chunks) > 1)  # 2
+        self.assertTrue(all(len(chunk) < 16 + len("99 --> ") for chunk in chunks))  # 2
+
+        # 3. Write to a text stream
+        out = io.StringIO()
+        self.assertEqual(len(sll.to_string()), sll.write_to(out, chunk_size=10))  # 3
+        self.assertEqual(sll.to_string(), out.getvalue())  # 3
+
+        # 4. Invalid chunk size
+        with self.assertRaises(ValueError):
+            list(sll.iter_chunks(chunk_size=0))  # 4
+
+    def test_save_load(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'roster.sll')
+
+            for payloads in [[], [7], [4, -2, 0, 2 ** 62], [0.5, 1.25, -3.0], ['C', 'S', 'E', 331, None],
+                             [1, 2.5], [2 ** 70, 1]]:
+                sll = SLL.from_iterable(payloads)
+                sll.save(path)
+                for mmap in [True, False]:
+                    loaded = SLL.load(path, mmap=mmap)
+
+                    # 1. Every payload round-trips in order
+                    self.assertEqual(payloads, list(loaded))  # 1
+                    self.assertEqual(sll.to_string(), loaded.to_string())  # 1
+                    self.assertEqual(len(payloads), loaded.length())  # 1
+                    if all(isinstance(data, (int, float)) for data in payloads):
+                        self.assertEqual(sll.total(), loaded.total())  # 1
+                    if payloads:
+                        self.assertEqual(payloads[-1], loaded.tail.data)  # 1
+                        self.assertIs(None, loaded.tail.next)  # 1
+                    del loaded
+
+            # 2. Homogeneous ints are stored as a packed array
+            SLL.from_iterable(range(1000)).save(path)
+            self.assertTrue(os.path.getsize(path) <= 64 + 8 * 1000)  # 2
+
+            # 3. Mapped nodes are only decoded when traversed
+            loaded = SLL.load(path)
+            self.assertEqual(1000, loaded.length())  # 3
+            self.assertEqual(sum(range(1000)), loaded.total())  # 3
+            self.assertIs(SLLNode, type(loaded.tail))  # 3
+            self.assertIsNot(SLLNode, type(loaded.head.next))  # 3
+            self.assertEqual([0, 1, 2], list(loaded.take(3)))  # 3
+            self.assertIs(SLLNode, type(loaded.head))  # 3
+
+            # 4. A mapped list can be mutated like any other
+            self.assertEqual(True, loaded.delete(200))  # 4
+            loaded.append(1000)
+            self.assertEqual(True, loaded.delete_all(250))  # 4
+            self.assertEqual([value for value in range(1001) if value not in (200, 250)], list(loaded))  # 4
+            self.assertEqual(SLL.from_iterable(list(loaded)), loaded)  # 4
+            del loaded
+
+            # 5. A lazily loaded list can be saved back over the file it is still mapping
+            for payloads in [['payload %d' % i for i in range(20000)], list(range(20000))]:
+                SLL.from_iterable(payloads).save(path)
+                loaded = SLL.load(path)
+                loaded.append('appended')
+                loaded.save(path)
+                self.assertEqual(payloads + ['appended'], list(loaded))  # 5
+                self.assertEqual(payloads + ['appended'], list(SLL.load(path)))  # 5
+                loaded.save(path)
+                self.assertEqual(payloads + ['appended'], list(SLL.load(path, mmap=False)))  # 5
+            self.assertEqual(['roster.sll'], os.listdir(directory))  # 5
+            del loaded
+
+            # 6. Files that are not saved SLLs are rejected
+            with open(path, 'wb') as fp:
+                fp.write(b'not an SLL')
+            with self.assertRaises(ValueError):
+                SLL.load(path)  # 6
+
+            # 7. New files get the usual permissions and existing files keep theirs
+            if os.name == 'posix':
+                umask = os.umask(0o022)
+                try:
+                    os.remove(path)
+                    SLL.from_iterable([1, 2]).save(path)
+                    self.assertEqual(0o644, os.stat(path).st_mode & 0o777)  # 7
+                    os.chmod(path, 0o640)
+                    SLL.from_iterable([3]).save(path)
+                    self.assertEqual(0o640, os.stat(path).st_mode & 0o777)  # 7
+                finally:
+                    os.umask(umask)
+
     def test_length(self):
         sll = SLL()
 
@@ -279,6 +483,47 @@ class MyTestCase(unittest.TestCase):
         self.assertIs(None, sll.head)  # 8
         self.assertIs(None, sll.tail)  # 8
 
+    def test_delete_many(self):
+        sll = SLL(count_values=True)
+
+        # 1. Delete from an empty list
+        self.assertEqual(0, sll.delete_many({1, 2}))  # 1
+        self.assertEqual(0, sll.remove_if(lambda data: True))  # 1
+
+        sll.extend([8, 5, 3, 5, 9, 3, 7, 0])  # SLL: 8 --> 5 --> 3 --> 5 --> 9 --> 3 --> 7 --> 0
+
+        # 2. Delete several values in one pass, including the head and tail
+        self.assertEqual(4, sll.delete_many({8, 3, 0}))  # 2, SLL: 5 --> 5 --> 9 --> 7
+        self.assertEqual("5 --> 5 --> 9 --> 7", sll.to_string())  # 2
+        self.assertEqual(7, sll.tail.data)  # 2
+        self.assertIs(None, sll.tail.next)  # 2
+        self.assertEqual(4, sll.length())  # 2
+        self.assertEqual(26, sll.total())  # 2
+        self.assertEqual(0, sll.find_sum(3))  # 2
+
+        # 3. Values not in the list
+        self.assertEqual(0, sll.delete_many([1, 2]))  # 3
+        self.assertEqual("5 --> 5 --> 9 --> 7", sll.to_string())  # 3
+
+        # 4. Remove by predicate
+        self.assertEqual(2, sll.remove_if(lambda data: data > 6))  # 4, SLL: 5 --> 5
+        self.assertEqual("5 --> 5", sll.to_string())  # 4
+        self.assertIs(sll.head.next, sll.tail)  # 4
+
+        # 5. Remove everything
+        self.assertEqual(2, sll.remove_if(lambda data: True))  # 5
+        self.assertIs(None, sll.head)  # 5
+        self.assertIs(None, sll.tail)  # 5
+        self.assertEqual(0, sll.length())  # 5
+
+        # 6. Indexed lists stay consistent
+        sll = SLL.from_iterable([1, 2, 3, 2, 1, 4], indexed=True)
+        self.assertEqual(4, sll.delete_many([1, 2]))  # 6, SLL: 3 --> 4
+        self.assertEqual(False, sll.find(2))  # 6
+        self.assertEqual(1, sll.remove_if(lambda data: data == 3))  # 6, SLL: 4
+        self.assertEqual(True, sll.delete(4))  # 6
+        self.assertIs(None, sll.head)  # 6
+
     def test_find(self):
         sll = SLL()
 
@@ -337,6 +582,626 @@ class MyTestCase(unittest.TestCase):
         sll.append('Hello')
         self.assertEqual(2, sll.find_sum('Hello'))  # 6
 
+    def test_maintained_aggregates(self):
+        sll = SLL(count_values=True)
+
+        # 1. Aggregates of an empty list
+        self.assertEqual(0, sll.length())  # 1
+        self.assertIs(None, sll.total())  # 1
+        self.assertEqual(0, sll.find_sum(4))  # 1
+
+        for value in [4, 2, 4, 1, 4]:
+            sll.append(value)  # SLL: 4 --> 2 --> 4 --> 1 --> 4
+
+        # 2. Aggregates after appends
+        self.assertEqual(5, sll.length())  # 2
+        self.assertEqual(15, sll.total())  # 2
+        self.assertEqual(3, sll.find_sum(4))  # 2
+        self.assertEqual(1, sll.find_sum(2))  # 2
+
+        # 3. Aggregates after delete
+        sll.delete(2)  # SLL: 4 --> 4 --> 1 --> 4
+        self.assertEqual(4, sll.length())  # 3
+        self.assertEqual(13, sll.total())  # 3
+        self.assertEqual(0, sll.find_sum(2))  # 3
+
+        # 4. Aggregates after delete_all
+        sll.delete_all(4)  # SLL: 1
+        self.assertEqual(1, sll.length())  # 4
+        self.assertEqual(1, sll.total())  # 4
+        self.assertEqual(0, sll.find_sum(4))  # 4
+        self.assertIs(sll.head, sll.tail)  # 4
+
+        # 5. Float totals are recomputed after a delete
+        sll.append(0.5)
+        sll.append(0.25)  # SLL: 1 --> 0.5 --> 0.25
+        self.assertEqual(1.75, sll.total())  # 5
+        sll.delete(1)  # SLL: 0.5 --> 0.25
+        self.assertEqual(0.75, sll.total())  # 5
+        self.assertEqual(2, sll.length())  # 5
+
+        # 6. help_mario leaves the aggregates untouched
+        roster = SLL(count_values=True)
+        for racer in ['Luigi', 'Toad', 'Yoshi']:
+            roster.append(racer)
+        self.assertIs(True, help_mario(roster, 'Yoshi'))  # 6
+        self.assertEqual('Yoshi --> Luigi --> Toad', roster.to_string())  # 6
+        self.assertEqual(3, roster.length())  # 6
+        self.assertEqual(1, roster.find_sum('Toad'))  # 6
+        self.assertEqual('YoshiLuigiToad', roster.total())  # 6
+
+        # 7. No per-instance __dict__
+        self.assertFalse(hasattr(sll, '__dict__'))  # 7
+
+    def test_indexed(self):
+        sll = SLL(indexed=True)
+
+        # 1. Find and delete in an empty indexed list
+        self.assertEqual(False, sll.find(3))  # 1
+        self.assertEqual(False, sll.delete(3))  # 1
+
+        for value in [3, 1, 3, 3, 2]:
+            sll.append(value)  # SLL: 3 --> 1 --> 3 --> 3 --> 2
+
+        # 2. Find through the index
+        self.assertEqual(True, sll.find(3))  # 2
+        self.assertEqual(False, sll.find(7))  # 2
+        self.assertEqual(3, sll.find_sum(3))  # 2
+
+        # 3. Delete only removes the first occurrence
+        self.assertEqual(True, sll.delete(3))  # 3, SLL: 1 --> 3 --> 3 --> 2
+        self.assertEqual("1 --> 3 --> 3 --> 2", sll.to_string())  # 3
+
+        # 4. Delete from the tail keeps tail correct
+        self.assertEqual(True, sll.delete(2))  # 4, SLL: 1 --> 3 --> 3
+        self.assertEqual(3, sll.tail.data)  # 4
+        self.assertIs(None, sll.tail.next)  # 4
+
+        # 5. Delete adjacent occurrences
+        self.assertEqual(True, sll.delete_all(3))  # 5, SLL: 1
+        self.assertIs(sll.head, sll.tail)  # 5
+        self.assertEqual(False, sll.find(3))  # 5
+
+        # 6. Randomized comparison against an unindexed list, including help_mario rotations
+        seed(331)
+        plain, indexed = SLL(), SLL(indexed=True)
+        for _ in range(2000):
+            op, value = randint(0, 4), randint(0, 9)
+            if op <= 1:
+                plain.append(value)
+                indexed.append(value)
+            elif op == 2:
+                self.assertEqual(plain.delete(value), indexed.delete(value))  # 6
+            elif op == 3:
+                self.assertEqual(plain.delete_all(value), indexed.delete_all(value))  # 6
+            else:
+                self.assertEqual(help_mario(plain, value), help_mario(indexed, value))  # 6
+            self.assertEqual(plain.find(value), indexed.find(value))  # 6
+            self.assertEqual(plain.find_sum(value), indexed.find_sum(value))  # 6
+        self.assertEqual(plain.to_string(), indexed.to_string())  # 6
+        self.assertIs(plain.tail is None, indexed.tail is None)  # 6
+
+    def test_compact(self):
+        compact = CompactSinglyLinkedList()
+
+        # 1. Empty compact list
+        self.assertEqual("None", compact.to_string())  # 1
+        self.assertEqual(0, compact.length())  # 1
+        self.assertIs(None, compact.total())  # 1
+        self.assertEqual(False, compact.delete(1))  # 1
+        self.assertEqual(0, compact.find_sum(1))  # 1
+
+        for value in [8, 5, 3, 5, 9]:
+            compact.append(value)  # SLL: 8 --> 5 --> 3 --> 5 --> 9
+
+        # 2. Same observable behaviour as SinglyLinkedList
+        self.assertEqual("8 --> 5 --> 3 --> 5 --> 9", compact.to_string())  # 2
+        self.assertEqual(5, compact.length())  # 2
+        self.assertEqual(30, compact.total())  # 2
+        self.assertEqual(2, compact.find_sum(5))  # 2
+        self.assertEqual(True, compact.find(9))  # 2
+
+        # 3. Delete the first occurrence, then all occurrences
+        self.assertEqual(True, compact.delete(5))  # 3
+        self.assertEqual("8 --> 3 --> 5 --> 9", compact.to_string())  # 3
+        self.assertEqual(True, compact.delete_all(9))  # 3
+        self.assertEqual("8 --> 3 --> 5", compact.to_string())  # 3
+
+        # 4. Deleted slots are reused
+        compact.append(1)
+        compact.append(2)
+        compact.append(4)  # SLL: 8 --> 3 --> 5 --> 1 --> 2 --> 4
+        self.assertEqual(6, len(compact._data))  # 4
+        self.assertEqual("8 --> 3 --> 5 --> 1 --> 2 --> 4", compact.to_string())  # 4
+
+        # 5. Randomized comparison against SinglyLinkedList
+        seed(331)
+        sll, compact = SLL(), CompactSinglyLinkedList()
+        for _ in range(2000):
+            op, value = randint(0, 3), randint(0, 9)
+            if op <= 1:
+                sll.append(value)
+                compact.append(value)
+            elif op == 2:
+                self.assertEqual(sll.delete(value), compact.delete(value))  # 5
+            else:
+                self.assertEqual(sll.delete_all(value), compact.delete_all(value))  # 5
+            self.assertEqual(sll.find_sum(value), compact.find_sum(value))  # 5
+        self.assertEqual(sll.to_string(), compact.to_string())  # 5
+        self.assertEqual(sll.length(), compact.length())  # 5
+        self.assertEqual(sll.total(), compact.total())  # 5
+
+    def test_rotate_and_splice(self):
+        sll = SLL.from_iterable([1, 2, 3, 4])
+        nodes = [sll.head, sll.head.next, sll.head.next.next, sll.tail]
+
+        # 1. Rotate to the head is a no-op
+        sll.rotate_to(nodes[0])
+        self.assertEqual("1 --> 2 --> 3 --> 4", sll.to_string())  # 1
+
+        # 2. Rotate with a known predecessor relinks the existing nodes
+        sll.rotate_to(nodes[2], nodes[1])  # SLL: 3 --> 4 --> 1 --> 2
+        self.assertEqual("3 --> 4 --> 1 --> 2", sll.to_string())  # 2
+        self.assertIs(nodes[2], sll.head)  # 2
+        self.assertIs(nodes[1], sll.tail)  # 2
+        self.assertIs(None, sll.tail.next)  # 2
+
+        # 3. Rotate looking the predecessor up
+        sll.rotate_to(nodes[1])  # SLL: 2 --> 3 --> 4 --> 1
+        self.assertEqual("2 --> 3 --> 4 --> 1", sll.to_string())  # 3
+        self.assertIs(nodes[0], sll.tail)  # 3
+
+        # 4. Splice the tail to the front
+        sll.splice(nodes[3], nodes[0])  # SLL: 1 --> 2 --> 3 --> 4
+        self.assertEqual("1 --> 2 --> 3 --> 4", sll.to_string())  # 4
+        self.assertIs(nodes[3], sll.tail)  # 4
+        self.assertIs(None, sll.tail.next)  # 4
+
+        # 5. Splice from the middle
+        sll.splice(nodes[1], nodes[2])  # SLL: 3 --> 1 --> 2 --> 4
+        self.assertEqual("3 --> 1 --> 2 --> 4", sll.to_string())  # 5
+        self.assertEqual(4, sll.length())  # 5
+
+        # 6. Mismatched predecessors are rejected
+        with self.assertRaises(ValueError):
+            sll.splice(nodes[0], nodes[3])  # 6
+        with self.assertRaises(ValueError):
+            sll.rotate_to(nodes[3], nodes[0])  # 6
+
+        # 7. Indexed lists keep first occurrences correct
+        sll = SLL.from_iterable([1, 2, 1, 3], indexed=True)
+        sll.splice(sll.head.next, sll.head.next.next)  # SLL: 1 --> 1 --> 2 --> 3
+        self.assertEqual(True, sll.delete(2))  # 7
+        sll.rotate_to(sll.tail)  # SLL: 3 --> 1 --> 1
+        self.assertEqual(True, sll.delete(1))  # 7
+        self.assertEqual("3 --> 1", sll.to_string())  # 7
+        self.assertEqual(1, sll.tail.data)  # 7
+
+    def test_help_mario_batch(self):
+        # 1. Empty roster
+        self.assertEqual([False, False], help_mario_batch(SLL(), ['Toad', 'Yoshi']))  # 1
+
+        # 2. Same answers and final order as repeated help_mario
+        seed(331)
+        racers = list(string.ascii_lowercase[:8]) * 2
+        for _ in range(100):
+            shuffle(racers)
+            single, batched = SLL.from_iterable(racers), SLL.from_iterable(racers)
+            allies = [string.ascii_lowercase[randint(0, 9)] for _ in range(randint(0, 6))]
+            expected = [help_mario(single, ally) for ally in allies]
+            self.assertEqual(expected, help_mario_batch(batched, allies))  # 2
+            self.assertEqual(single.to_string(), batched.to_string())  # 2
+            self.assertIs(None, batched.tail.next)  # 2
+
+    def test_sort(self):
+        # 1. Sort empty and one-element lists
+        sll = SLL()
+        sll.sort()
+        self.assertIs(None, sll.head)  # 1
+        sll.append(1)
+        sll.sort()
+        self.assertIs(sll.head, sll.tail)  # 1
+
+        # 2. Sort by relinking the existing nodes
+        sll = SLL.from_iterable([5, 2, 9, 1, 5, 6])
+        node_ids = set()
+        node = sll.head
+        while node is not None:
+            node_ids.add(id(node))
+            node = node.next
+        sll.sort()
+        self.assertEqual("1 --> 2 --> 5 --> 5 --> 6 --> 9", sll.to_string())  # 2
+        self.assertEqual(9, sll.tail.data)  # 2
+        self.assertIs(None, sll.tail.next)  # 2
+        node = sll.head
+        while node is not None:
+            self.assertIn(id(node), node_ids)  # 2
+            node = node.next
+
+        # 3. Descending order
+        sll.sort(descending=True)
+        self.assertEqual("9 --> 6 --> 5 --> 5 --> 2 --> 1", sll.to_string())  # 3
+
+        # 4. Stable with a custom comparator
+        sll = SLL.from_iterable([(2, 'a'), (1, 'b'), (2, 'c'), (1, 'd')])
+        sll.sort(comparator=lambda x, y: x[0] < y[0])
+        self.assertEqual([(1, 'b'), (1, 'd'), (2, 'a'), (2, 'c')],
+                         [sll.head.data, sll.head.next.data, sll.head.next.next.data, sll.tail.data])  # 4
+
+        # 5. Randomized comparison against sorted(), keeping aggregates and the index
+        seed(331)
+        for size in range(40):
+            data = [randint(0, 20) for _ in range(size)]
+            sll = SLL.from_iterable(data, indexed=True)
+            sll.sort()
+            self.assertEqual(SLL.from_iterable(sorted(data)).to_string(), sll.to_string())  # 5
+            self.assertEqual(size, sll.length())  # 5
+            if data:
+                self.assertEqual(max(data), sll.tail.data)  # 5
+                self.assertEqual(True, sll.delete(sll.tail.data))  # 5
+                self.assertEqual(size - 1, sll.length())  # 5
+
+    def test_merge_sorted(self):
+        # 1. Merge two sorted lists
+        sll = SLL.from_iterable([1, 4, 6])
+        other = SLL.from_iterable([2, 3, 7, 8])
+        sll.merge_sorted(other)
+        self.assertEqual("1 --> 2 --> 3 --> 4 --> 6 --> 7 --> 8", sll.to_string())  # 1
+        self.assertEqual(8, sll.tail.data)  # 1
+        self.assertEqual(7, sll.length())  # 1
+        self.assertEqual(31, sll.total())  # 1
+        self.assertIs(None, other.head)  # 1
+
+        # 2. Merge into and from empty lists
+        sll = SLL()
+        sll.merge_sorted(SLL.from_iterable([1, 2]))
+        self.assertEqual("1 --> 2", sll.to_string())  # 2
+        sll.merge_sorted(SLL())
+        self.assertEqual("1 --> 2", sll.to_string())  # 2
+
+        # 3. Descending merge keeps this list first on ties
+        sll = SLL.from_iterable([(3, 'self'), (1, 'self')])
+        other = SLL.from_iterable([(3, 'other'), (2, 'other')])
+        sll.merge_sorted(other, comparator=lambda x, y: x[0] < y[0], descending=True)
+        self.assertEqual((3, 'self'), sll.head.data)  # 3
+        self.assertEqual((3, 'other'), sll.head.next.data)  # 3
+        self.assertEqual((1, 'self'), sll.tail.data)  # 3
+        with self.assertRaises(ValueError):
+            sll.merge_sorted(sll)  # 3
+
+    def test_eq(self):
+        # 1. Empty lists and a list with itself
+        self.assertEqual(SLL(), SLL())  # 1
+        sll = SLL.from_iterable([1, 2, 3])
+        self.assertEqual(sll, sll)  # 1
+
+        # 2. Equal data in the same order
+        other = SLL()
+        for value in [1, 2, 3]:
+            other.append(value)
+        self.assertEqual(sll, other)  # 2
+
+        # 3. Different lengths, values and orders
+        self.assertNotEqual(sll, SLL.from_iterable([1, 2]))  # 3
+        self.assertNotEqual(sll, SLL.from_iterable([1, 2, 4]))  # 3
+        self.assertNotEqual(sll, SLL.from_iterable([3, 2, 1]))  # 3
+        self.assertNotEqual(sll, SLL())  # 3
+
+        # 4. Deletes drop the fingerprint and comparisons walk instead of recomputing it
+        other.append(4)
+        other.delete(2)  # SLL: 1 --> 3 --> 4
+        self.assertEqual(SLL.from_iterable([1, 3, 4]), other)  # 4
+        self.assertNotEqual(SLL.from_iterable([1, 4, 3]), other)  # 4
+        self.assertIs(None, other._fingerprint)  # 4
+
+        # 5. Unhashable payloads fall back to walking
+        self.assertEqual(SLL.from_iterable([[1], [2]]), SLL.from_iterable([[1], [2]]))  # 5
+        self.assertNotEqual(SLL.from_iterable([[1], [2]]), SLL.from_iterable([[1], [3]]))  # 5
+
+        # 6. Lists longer than the recursion limit
+        big = SLL.from_iterable(range(20000))
+        self.assertEqual(big, SLL.from_iterable(range(20000)))  # 6
+        self.assertNotEqual(big, SLL.from_iterable(range(1, 20001)))  # 6
+
+        # 7. Maintained fingerprints always match a fresh computation
+        seed(331)
+        sll = SLL()
+        for _ in range(1000):
+            op, value = randint(0, 5), randint(0, 9)
+            if op <= 2:
+                sll.append(value)
+            elif op == 3:
+                sll.delete(value)
+            elif op == 4:
+                sll.delete_all(value)
+            else:
+                help_mario(sll, value)
+            self.assertEqual(SLL.from_iterable(list(sll)), sll)  # 7
+            if sll._fingerprint is not None:
+                expected = sll._fingerprint
+                sll._fingerprint = None
+                self.assertEqual(expected, sll._current_fingerprint())  # 7
+
+        # 8. Emptying a list by deletion leaves it comparable with lists built afresh
+        emptied = SLL()
+        emptied.append(1)
+        self.assertEqual(SLL.from_iterable([1]), emptied)  # 8
+        emptied.delete(1)
+        emptied.append(5)
+        self.assertEqual(SLL.from_iterable([5]), emptied)  # 8
+        self.assertEqual(SLL.from_iterable([5])._fingerprint, emptied._fingerprint)  # 8
+        emptied.extend([6, 7])
+        self.assertEqual(SLL.from_iterable([5, 6, 7]), emptied)  # 8
+        other = SLL.from_iterable([8])
+        self.assertEqual(SLL.from_iterable([8]), other)  # 8
+        emptied.extend_list(other)
+        self.assertEqual(SLL.from_iterable([5, 6, 7, 8]), emptied)  # 8
+
+    def test_unrolled(self):
+        unrolled = UnrolledSinglyLinkedList(capacity=4)
+
+        # 1. Empty unrolled list
+        self.assertEqual("None", unrolled.to_string())  # 1
+        self.assertEqual(0, unrolled.length())  # 1
+        self.assertIs(None, unrolled.total())  # 1
+        self.assertEqual(False, unrolled.find(1))  # 1
+        self.assertEqual(False, unrolled.delete(1))  # 1
+        with self.assertRaises(ValueError):
+            UnrolledSinglyLinkedList(capacity=0)  # 1
+
+        for value in range(10):
+            unrolled.append(value)
+
+        # 2. Payloads are packed into nodes of at most `capacity`
+        self.assertEqual([0, 1, 2, 3], unrolled.head.items)  # 2
+        self.assertEqual([8, 9], unrolled.tail.items)  # 2
+        self.assertEqual(list(range(10)), list(unrolled))  # 2
+        self.assertEqual(10, unrolled.length())  # 2
+        self.assertEqual(45, unrolled.total())  # 2
+
+        # 3. Deleting a whole node relinks head and tail
+        for value in [8, 9]:
+            unrolled.delete(value)
+        self.assertEqual([4, 5, 6, 7], unrolled.tail.items)  # 3
+        self.assertIs(None, unrolled.tail.next)  # 3
+        self.assertEqual("0 --> 1 --> 2 --> 3 --> 4 --> 5 --> 6 --> 7", unrolled.to_string())  # 3
+
+        # 4. Underfilled nodes absorb their successor
+        for value in [4, 5, 6, 1, 2, 3]:
+            unrolled.delete(value)
+        self.assertEqual([0, 7], unrolled.head.items)  # 4
+        self.assertIs(unrolled.head, unrolled.tail)  # 4
+        self.assertEqual(2, unrolled.length())  # 4
+
+        # 5. Identity semantics match SinglyLinkedList
+        big, other = 10 ** 20, 10 ** 20 + 0
+        unrolled = UnrolledSinglyLinkedList()
+        unrolled.append(big)
+        self.assertEqual(True, unrolled.find(big))  # 5
+        self.assertEqual(True, unrolled.delete(big))  # 5
+        self.assertIs(None, unrolled.head)  # 5
+
+        # 6. Randomized comparison against SinglyLinkedList
+        seed(331)
+        sll, unrolled = SLL(), UnrolledSinglyLinkedList(capacity=3)
+        for _ in range(3000):
+            op, value = randint(0, 3), randint(0, 9)
+            if op <= 1:
+                sll.append(value)
+                unrolled.append(value)
+            elif op == 2:
+                self.assertEqual(sll.delete(value), unrolled.delete(value))  # 6
+            else:
+                self.assertEqual(sll.delete_all(value), unrolled.delete_all(value))  # 6
+            self.assertEqual(sll.find(value), unrolled.find(value))  # 6
+            self.assertEqual(sll.find_sum(value), unrolled.find_sum(value))  # 6
+            self.assertEqual(sll.length(), unrolled.length())  # 6
+        self.assertEqual(sll.to_string(), unrolled.to_string())  # 6
+        self.assertEqual(sll.total(), unrolled.total())  # 6
+
+        # 7. Payloads are only compared by identity, so an `__eq__` that raises is never called
+        class Opaque:
+            def __eq__(self, other):
+                raise TypeError("Opaque payloads cannot be compared")
+
+            __hash__ = object.__hash__
+
+        first, second = Opaque(), Opaque()
+        unrolled = UnrolledSinglyLinkedList(capacity=4)
+        for data in (first, second, first):
+            unrolled.append(data)
+        self.assertEqual(True, unrolled.find(second))  # 7
+        self.assertEqual(False, unrolled.find(Opaque()))  # 7
+        self.assertEqual(2, unrolled.find_sum(first))  # 7
+        self.assertEqual(True, unrolled.delete(second))  # 7
+        self.assertEqual(True, unrolled.delete_all(first))  # 7
+        self.assertEqual(0, unrolled.length())  # 7
+
+    def test_node_pool(self):
+        pool = SLLNodePool(capacity=2)
+        sll = SLL(pool=pool)
+
+        # 1. Appending to an empty pool allocates
+        for value in [1, 2, 3, 2]:
+            sll.append(value)  # SLL: 1 --> 2 --> 3 --> 2
+        self.assertEqual(0, pool.hits)  # 1
+        self.assertEqual(4, pool.misses)  # 1
+        self.assertEqual(0, len(pool))  # 1
+
+        # 2. Deleted nodes go back to the pool, up to its capacity
+        removed = sll.head.next
+        sll.delete(2)  # SLL: 1 --> 3 --> 2
+        self.assertEqual(1, len(pool))  # 2
+        self.assertIs(None, removed.data)  # 2
+        sll.delete_all(3)
+        sll.delete_all(1)  # SLL: 2
+        self.assertEqual(2, len(pool))  # 2
+        self.assertEqual("2", sll.to_string())  # 2
+        self.assertIs(sll.head, sll.tail)  # 2
+
+        # 3. Appends reuse pooled nodes
+        sll.append(5)
+        self.assertEqual(1, pool.hits)  # 3
+        sll.extend([6, 7])  # SLL: 2 --> 5 --> 6 --> 7
+        self.assertEqual(2, pool.hits)  # 3
+        self.assertEqual(5, pool.misses)  # 3
+        self.assertEqual("2 --> 5 --> 6 --> 7", sll.to_string())  # 3
+        self.assertIs(None, sll.tail.next)  # 3
+
+        # 4. A pool can be shared, including by indexed lists
+        other = SLL(indexed=True, pool=pool)
+        other.extend([1, 1, 2])
+        other.delete_all(1)
+        self.assertEqual(2, len(pool))  # 4
+        self.assertEqual(2, sll.remove_if(lambda data: data > 5))  # 4
+        self.assertEqual(2, len(pool))  # 4
+        self.assertEqual("2 --> 5", sll.to_string())  # 4
+        self.assertEqual("2", other.to_string())  # 4
+
+    def test_sorted(self):
+        ordered = SortedLinkedList(seed=331)
+
+        # 1. Empty sorted list
+        self.assertEqual("None", ordered.to_string())  # 1
+        self.assertEqual(0, ordered.length())  # 1
+        self.assertIs(None, ordered.total())  # 1
+        self.assertEqual(False, ordered.find(1))  # 1
+        self.assertEqual(False, ordered.delete(1))  # 1
+        self.assertEqual(0, ordered.find_sum(1))  # 1
+
+        # 2. Insert in order
+        for value in [5, 2, 8, 2, 1]:
+            ordered.insert(value)
+        self.assertEqual("1 --> 2 --> 2 --> 5 --> 8", ordered.to_string())  # 2
+        self.assertEqual(1, ordered.head.data)  # 2
+        self.assertEqual(8, ordered.tail.data)  # 2
+        self.assertIs(None, ordered.tail.next)  # 2
+        self.assertEqual(5, ordered.length())  # 2
+        self.assertEqual(18, ordered.total())  # 2
+        self.assertEqual(2, ordered.find_sum(2))  # 2
+        self.assertEqual(True, ordered.find(5))  # 2
+        self.assertEqual(False, ordered.find(4))  # 2
+
+        # 3. Delete the head, the tail and a duplicate
+        self.assertEqual(True, ordered.delete(1))  # 3
+        self.assertEqual(True, ordered.delete(8))  # 3
+        self.assertEqual(True, ordered.delete(2))  # 3
+        self.assertEqual("2 --> 5", ordered.to_string())  # 3
+        self.assertEqual(5, ordered.tail.data)  # 3
+
+        # 4. Descending order with a custom comparator, equal data keeps insertion order
+        ordered = SortedLinkedList(comparator=lambda x, y: x[0] < y[0], descending=True, seed=331)
+        for pair in [(1, 'a'), (3, 'b'), (1, 'c'), (2, 'd')]:
+            ordered.insert(pair)
+        self.assertEqual([(3, 'b'), (2, 'd'), (1, 'a'), (1, 'c')], list(ordered))  # 4
+
+        # 5. Randomized comparison against a sorted Python list
+        seed(331)
+        ordered, expected = SortedLinkedList(seed=331), []
+        for _ in range(3000):
+            value = randint(0, 200)
+            if randint(0, 2):
+                ordered.insert(value)
+                expected.append(value)
+                expected.sort()
+            else:
+                self.assertEqual(value in expected, ordered.delete(value))  # 5
+                if value in expected:
+                    expected.remove(value)
+            self.assertEqual(value in expected, ordered.find(value))  # 5
+        self.assertEqual(expected, list(ordered))  # 5
+        self.assertEqual(len(expected), ordered.length())  # 5
+        self.assertEqual(sum(expected), ordered.total())  # 5
+        self.assertTrue(len(ordered._lanes) > 1)  # 5
+
+    def test_concurrent(self):
+        sll = ConcurrentSinglyLinkedList()
+
+        # 1. Empty concurrent list
+        self.assertEqual("None", sll.to_string())  # 1
+        self.assertIs(None, sll.head)  # 1
+        self.assertIs(None, sll.tail)  # 1
+        self.assertEqual(False, sll.delete(1))  # 1
+        self.assertEqual([], list(sll))  # 1
+
+        # 2. Single-threaded behaviour matches SinglyLinkedList
+        for value in [4, 2, 4, 1]:
+            sll.append(value)
+        self.assertEqual("4 --> 2 --> 4 --> 1", sll.to_string())  # 2
+        self.assertEqual(True, sll.delete(1))  # 2
+        self.assertEqual(4, sll.tail.data)  # 2
+        self.assertEqual(True, sll.delete_all(4))  # 2
+        self.assertEqual([2], list(sll))  # 2
+        self.assertIs(sll.head, sll.tail)  # 2
+        self.assertEqual(True, sll.find(2))  # 2
+        self.assertEqual(1, sll.length())  # 2
+        sll.delete(2)
+        self.assertIs(None, sll.tail)  # 2
+        self.assertEqual(0, sll.length())  # 2
+        sll.append(7)
+        self.assertIs(sll.head, sll.tail)  # 2
+
+        # 3. Many producers with a concurrent deleter lose no appends
+        sll = ConcurrentSinglyLinkedList()
+        per_thread, producers = 2000, 4
+        marker = 'marker'
+
+        def produce(offset):
+            for i in range(per_thread):
+                sll.append(offset + i)
+                if i % 100 == 0:
+                    sll.append(marker)
+
+        def consume():
+            for _ in range(200):
+                sll.delete(marker)
+
+        workers = [threading.Thread(target=produce, args=(k * per_thread,)) for k in range(producers)]
+        workers.append(threading.Thread(target=consume))
+        for worker in workers:
+            worker.start()
+        snapshots = [sll.snapshot() for _ in range(5)]
+        for worker in workers:
+            worker.join()
+        sll.delete_all(marker)
+
+        data = list(sll)
+        self.assertEqual(list(range(producers * per_thread)), sorted(data))  # 3
+        self.assertEqual(len(data), sll.length())  # 3
+        self.assertIs(None, sll.tail.next)  # 3
+        self.assertEqual(data[-1], sll.tail.data)  # 3
+        for snapshot in snapshots:
+            numbers = [value for value in snapshot if value is not marker]
+            for k in range(producers):
+                mine = [value for value in numbers if k * per_thread <= value < (k + 1) * per_thread]
+                self.assertEqual(list(range(k * per_thread, k * per_thread + len(mine))), mine)  # 3
+
+    def test_pickle(self):
+        # 1. Round-trip an empty list
+        self.assertEqual(SLL(), pickle.loads(pickle.dumps(SLL())))  # 1
+
+        # 2. Round-trip a list much longer than the recursion limit
+        sll = SLL.from_iterable(range(20000))
+        restored = pickle.loads(pickle.dumps(sll))
+        self.assertEqual(sll, restored)  # 2
+        self.assertIsNot(sll.head, restored.head)  # 2
+        self.assertEqual(19999, restored.tail.data)  # 2
+        self.assertEqual(20000, restored.length())  # 2
+
+        # 3. Counting and index options are kept
+        sll = SLL.from_iterable(['Toad', 'Yoshi', 'Toad'], count_values=True, indexed=True)
+        restored = pickle.loads(pickle.dumps(sll))
+        self.assertIsNotNone(restored._counts)  # 3
+        self.assertEqual(True, restored.delete(restored.tail.data))  # 3
+        self.assertEqual("Yoshi --> Toad", restored.to_string())  # 3
+
+        # 4. Copies are independent lists
+        sll = SLL.from_iterable([1, 2, 3])
+        duplicate = copy.copy(sll)
+        duplicate.delete(2)
+        self.assertEqual("1 --> 2 --> 3", sll.to_string())  # 4
+        self.assertEqual("1 --> 3", duplicate.to_string())  # 4
+
     def test_help_mario(self):
         roster = SLL()
 
@@ -6,7 +6,10 @@ Originally Authored By: Andrew McDonald & Alex Woodring & Andrew Haas & Matt Kig
 solution.py
 """
 
-from typing import TypeVar, List
+from abc import ABC, abstractmethod
+from collections import deque
+from random import random
+from typing import TypeVar, List, Callable, Dict, Hashable, Iterable, Iterator, Tuple, Union
 
 # for more information on type hinting, check out https://docs.python.org/3/library/typing.html
 T = TypeVar("T")  # represents generic type
@@ -53,21 +56,169 @@ class Node:
     __str__ = __repr__
 
 
+def _chain_state(head: Node) -> List[tuple]:
+    """
+    Flatten a chain of Nodes, and every chain hanging off their `child` references, into picklable levels.
+    Works iteratively, so neither long chains nor deep nesting recurse.
+
+    :param head: first Node of the top-level chain, may be None.
+    :return: list of levels, top level first. Each level is (values, links) where links holds
+    (index of the Node within the level, level number of its child chain) pairs.
+    """
+    levels = []
+    pending = [(head, None, None)]
+    while pending:
+        node, parent, index = pending.pop()
+        values, links = [], []
+        if parent is not None:
+            levels[parent][1].append((index, len(levels)))
+        levels.append((values, links))
+        while node is not None:
+            if node.child is not None:
+                pending.append((node.child, len(levels) - 1, len(values)))
+            values.append(node.value)
+            node = node.next
+    return levels
+
+
+def _chain_from_state(levels: List[tuple]) -> tuple:
+    """
+    Rebuild the chains flattened by `_chain_state`, relinking `next`, `prev` and `child` references.
+
+    :param levels: levels produced by `_chain_state`.
+    :return: (head, tail, length) of the top-level chain.
+    """
+    chains = []
+    for values, _ in levels:
+        nodes = [Node(value) for value in values]
+        for left, right in zip(nodes, nodes[1:]):
+            left.next = right
+            right.prev = left
+        chains.append(nodes)
+    for nodes, (_, links) in zip(chains, levels):
+        for index, level in links:
+            nodes[index].child = chains[level][0] if chains[level] else None
+
+    top = chains[0]
+    if not top:
+        return None, None, 0
+    return top[0], top[-1], len(top)
+
+
+def _ordering(comparator: Callable[[T, T], bool], descending: bool) -> Callable[[T, T], bool]:
+    """
+    Builds the "should come first" test used by the sorting module's `do_comparison`.
+
+    :param comparator: returns True when the first argument should be treated as less than the second.
+    :param descending: if True, reverse the order.
+    :return: function returning True if its first argument should be placed before its second.
+    """
+    if descending:
+        return lambda first, second: comparator(second, first) > 0
+    return lambda first, second: comparator(first, second) > 0
+
+
+def _cut_after(node: Node, count: int) -> Node:
+    """
+    Detaches the chain after the first `count` Nodes starting at `node`, following next references only.
+
+    :param node: first Node of the chain, may be None.
+    :param count: number of Nodes to keep attached to `node`.
+    :return: first Node of the detached remainder, None if there is none.
+    """
+    for _ in range(count - 1):
+        if node is None:
+            return None
+        node = node.next
+    if node is None:
+        return None
+    rest = node.next
+    node.next = None
+    return rest
+
+
+def _merge_runs(left: Node, right: Node, before: Callable[[T, T], bool]) -> Tuple[Node, Node]:
+    """
+    Stably merges two sorted, None-terminated chains by relinking their Nodes, fixing prev references as it goes
+    (except on the returned head, which the caller links in).
+
+    :param left: head of the first chain, wins ties.
+    :param right: head of the second chain, may be None.
+    :param before: returns True if its first argument should be placed before its second.
+    :return: (head, tail) of the merged chain.
+    """
+    if right is None or not before(right.value, left.value):
+        head = tail = left
+        left = left.next
+    else:
+        head = tail = right
+        right = right.next
+    while left is not None and right is not None:
+        if before(right.value, left.value):
+            right.prev = tail
+            tail.next = tail = right
+            right = right.next
+        else:
+            left.prev = tail
+            tail.next = tail = left
+            left = left.next
+    tail.next = left if left is not None else right
+    while tail.next is not None:
+        tail.next.prev = tail
+        tail = tail.next
+    return head, tail
+
+
+class _Lane:
+    """
+    Express-lane entry of an indexable DLL, skipping ahead over the Node chain.
+    """
+    __slots__ = ["node", "next", "down", "width"]
+
+    def __init__(self, node: Node, next: "_Lane" = None, down: "_Lane" = None) -> None:
+        """
+        Construct an express-lane entry.
+
+        :param node: Node this entry stands for, None for the sentinel in front of the head.
+        :param next: next entry on the same lane.
+        :param down: entry for the same Node (or the sentinel) one lane below, None on the lowest lane.
+        :return: None.
+        """
+        self.node = node
+        self.next = next
+        self.down = down
+        # number of chain positions from this entry's Node to next's Node, only meaningful if next is not None
+        self.width = 0
+
+
 class DLL:
     """
     Implementation of a doubly linked list without padding nodes.
     Modify only below indicated line.
     """
-    __slots__ = ["head", "tail", "size"]
+    __slots__ = ["head", "tail", "size", "_index", "_reversed", "_indexable", "_lanes"]
 
-    def __init__(self) -> None:
+    MAX_LANES = 32
+
+    def __init__(self, indexed: bool = False, indexable: bool = False) -> None:
         """
         Construct an empty doubly linked list.
 
+        :param indexed: if True, keep an index from each value to its live Nodes (in list order) so that find,
+        find_all and remove are O(1) and remove_all is O(k). Values must then be hashable.
+        :param indexable: if True, keep order-statistic express lanes (a skip list) over the Node chain so that get,
+        insert_at, remove_at, push and pop take O(log n) expected time. Operations that relink Nodes other than by
+        position (e.g. remove, list_to_dll, materialize) drop the lanes, and they are rebuilt on the next positional
+        access.
         :return: None.
         """
         self.head = self.tail = None
         self.size = 0
+        self._index = {} if indexed else None
+        self._reversed = False
+        self._indexable = indexable
+        # _lanes[i] is the sentinel of lane i + 1; lane 0 is the Node chain itself. None until built, or once stale
+        self._lanes = None
 
     def __repr__(self) -> str:
         """
@@ -75,12 +226,7 @@ class DLL:
 
         :return: string representation of the DLL.
         """
-        result = []
-        node = self.head
-        while node is not None:
-            result.append(str(node))
-            node = node.next
-        return " <-> ".join(result)
+        return " <-> ".join(str(node) for node in self._iter_nodes())
 
     def __str__(self) -> str:
         """
@@ -92,6 +238,286 @@ class DLL:
 
     # MODIFY BELOW #
 
+    def __reduce__(self) -> tuple:
+        """
+        Pickle (and copy) the DLL as flat sequences of values, so linked nodes are not recursed into one by one.
+
+        :return: reconstruction recipe for `pickle`/`copy`.
+        """
+        return self.__class__, (self._index is not None, self._indexable), (_chain_state(self.head), self._reversed)
+
+    def __setstate__(self, state: tuple) -> None:
+        """
+        Relink an unpickled DLL from the state built by `__reduce__`.
+
+        :param state: (levels, reversed) where levels holds the values of the top level and of every child level in
+        physical order, see `_chain_state`, and reversed is the logical orientation flag.
+        :return: None.
+        """
+        levels, self._reversed = state
+        self.head, self.tail, self.size = _chain_from_state(levels)
+        if self._index is not None:
+            self._reindex()
+
+    def _index_add(self, node: Node, back: bool) -> None:
+        """
+        Record a Node that was just linked in at the back (or front) of the DLL in the value index.
+
+        :param node: Node that was linked in.
+        :param back: True if node is now the tail, False if it is now the head.
+        :return: None.
+        """
+        occurrences = self._index.get(node.value)
+        if occurrences is None:
+            self._index[node.value] = deque((node,))
+        elif back:
+            occurrences.append(node)
+        else:
+            occurrences.appendleft(node)
+
+    def _index_discard(self, node: Node) -> None:
+        """
+        Drop a Node that is being unlinked from the value index.
+
+        :param node: Node being unlinked.
+        :return: None.
+        """
+        occurrences = self._index[node.value]
+        if occurrences[0] is node:
+            occurrences.popleft()
+        elif occurrences[-1] is node:
+            occurrences.pop()
+        else:
+            occurrences.remove(node)
+        if not occurrences:
+            del self._index[node.value]
+
+    def _reindex(self) -> None:
+        """
+        Rebuild the value index from the Nodes currently linked into the DLL.
+
+        :return: None.
+        """
+        self._index = {}
+        node = self.head
+        while node is not None:
+            self._index_add(node, True)
+            node = node.next
+
+    def _index_insert(self, node: Node) -> None:
+        """
+        Record a Node that was just linked in somewhere in the middle of the DLL in the value index, keeping its
+        occurrences in list order. Searches outwards from node for the nearest equal value (or end of the DLL).
+
+        :param node: Node that was linked in.
+        :return: None.
+        """
+        occurrences = self._index.get(node.value)
+        if occurrences is None:
+            self._index[node.value] = deque((node,))
+            return None
+
+        before, after = node.prev, node.next
+        while True:
+            if after is None:
+                occurrences.append(node)
+                return None
+            if after.value == node.value:
+                occurrences.insert(occurrences.index(after), node)
+                return None
+            if before is None:
+                occurrences.appendleft(node)
+                return None
+            if before.value == node.value:
+                occurrences.insert(occurrences.index(before) + 1, node)
+                return None
+            before, after = before.prev, after.next
+
+    def _ready_lanes(self) -> List[_Lane]:
+        """
+        Returns the express lanes of an indexable DLL, rebuilding them in one pass over the chain if they are stale.
+
+        :return: list of lane sentinels, lowest lane first, or None if the DLL is not indexable.
+        """
+        if self._lanes is not None or not self._indexable:
+            return self._lanes
+
+        lanes, last = [], []
+        curNode, pos = self.head, 0
+        while curNode is not None:
+            below = None
+            for level in range(self._height()):
+                if level == len(lanes):
+                    lanes.append(_Lane(None, None, lanes[-1] if lanes else None))
+                    last.append((lanes[-1], -1))
+                entry, entry_pos = last[level]
+                below = entry.next = _Lane(curNode, None, below)
+                entry.width = pos - entry_pos
+                last[level] = (below, pos)
+            curNode, pos = curNode.next, pos + 1
+        self._lanes = lanes
+        return lanes
+
+    def _height(self) -> int:
+        """
+        Flips coins for the number of express lanes a new Node is promoted to.
+
+        :return: number of lanes, 0 with probability 1/2.
+        """
+        height = 0
+        while height < self.MAX_LANES and random() < 0.5:
+            height += 1
+        return height
+
+    def _descend(self, position: int) -> List[Tuple[_Lane, int]]:
+        """
+        Walks the express lanes down to the chain, stopping at the last entry at or before a physical position.
+
+        :param position: physical position (counted from self.head) to descend towards, -1 for before the head.
+        :return: (entry, its physical position) for each lane, lowest lane first.
+        """
+        lanes = self._lanes
+        path = [None] * len(lanes)
+        if not lanes:
+            return path
+        entry, pos = lanes[-1], -1
+        for level in range(len(lanes) - 1, -1, -1):
+            nxt = entry.next
+            while nxt is not None and pos + entry.width <= position:
+                pos += entry.width
+                entry, nxt = nxt, nxt.next
+            path[level] = (entry, pos)
+            entry = entry.down
+        return path
+
+    def _walk(self, path: List[Tuple[_Lane, int]], position: int) -> Node:
+        """
+        Finishes a descent along the chain itself.
+
+        :param path: lane path from _descend, for a position at or before position.
+        :param position: physical position of the Node to return.
+        :return: Node at physical position position.
+        """
+        entry, pos = path[0] if path else (None, -1)
+        if entry is None or entry.node is None:
+            curNode, pos = self.head, 0
+        else:
+            curNode = entry.node
+        for _ in range(position - pos):
+            curNode = curNode.next
+        return curNode
+
+    def _lanes_insert(self, path: List[Tuple[_Lane, int]], position: int, node: Node) -> None:
+        """
+        Adds a Node just linked in at a physical position to the express lanes.
+
+        :param path: lane path from _descend(position - 1), taken before node was counted.
+        :param position: physical position of node.
+        :param node: Node that was linked in.
+        :return: None.
+        """
+        lanes = self._lanes
+        height = self._height()
+        below = None
+        for level, (entry, pos) in enumerate(path):
+            if level < height:
+                below = _Lane(node, entry.next, below)
+                if entry.next is not None:
+                    below.width = pos + entry.width + 1 - position
+                entry.next = below
+                entry.width = position - pos
+            elif entry.next is not None:
+                entry.width += 1
+        for _ in range(len(path), height):
+            below = _Lane(node, None, below)
+            lanes.append(_Lane(None, below, lanes[-1] if lanes else None))
+            lanes[-1].width = position + 1
+
+    def _lanes_remove(self, path: List[Tuple[_Lane, int]], node: Node) -> None:
+        """
+        Drops a Node that is about to be unlinked from the express lanes.
+
+        :param path: lane path from _descend(position - 1), where position is the physical position of node.
+        :param node: Node being unlinked.
+        :return: None.
+        """
+        lanes = self._lanes
+        for entry, _ in path:
+            nxt = entry.next
+            if nxt is None:
+                continue
+            if nxt.node is node:
+                entry.next = nxt.next
+                if nxt.next is not None:
+                    entry.width += nxt.width - 1
+            else:
+                entry.width -= 1
+        while lanes and lanes[-1].next is None:
+            lanes.pop()
+
+    def _physical(self, index: int) -> int:
+        """
+        Translates a logical position into a physical one (counted from self.head), honouring a lazy reverse.
+
+        :param index: logical position.
+        :return: physical position.
+        """
+        return self.size - 1 - index if self._reversed else index
+
+    def _node_at(self, position: int) -> Node:
+        """
+        Returns the Node at a physical position, using the express lanes if the DLL is indexable and otherwise
+        walking in from the nearer end.
+
+        :param position: physical position, 0 <= position < size.
+        :return: Node at that position.
+        """
+        if self._ready_lanes() is not None:
+            return self._walk(self._descend(position), position)
+        if position < self.size // 2:
+            curNode = self.head
+            for _ in range(position):
+                curNode = curNode.next
+        else:
+            curNode = self.tail
+            for _ in range(self.size - 1 - position):
+                curNode = curNode.prev
+        return curNode
+
+    def _slice_values(self, positions: range) -> Iterator[T]:
+        """
+        Yields the values at a range of logical positions, walking the chain from the first of them.
+
+        :param positions: logical positions, as produced by slice.indices.
+        :return: generator over the values.
+        """
+        if not positions:
+            return None
+        curNode = self._node_at(self._physical(positions[0]))
+        step = -positions.step if self._reversed else positions.step
+        for _ in range(len(positions) - 1):
+            yield curNode.value
+            for _ in range(abs(step)):
+                curNode = curNode.next if step > 0 else curNode.prev
+        yield curNode.value
+
+    def _iter_nodes(self) -> Iterator[Node]:
+        """
+        Yields the Nodes of the DLL in logical order, i.e. from tail to head while the DLL is lazily reversed.
+
+        :return: generator over the Nodes of the DLL.
+        """
+        if self._reversed:
+            curNode = self.tail
+            while curNode is not None:
+                yield curNode
+                curNode = curNode.prev
+        else:
+            curNode = self.head
+            while curNode is not None:
+                yield curNode
+                curNode = curNode.next
+
     def empty(self) -> bool:
         """
         Returns a boolean indicating whether the DLL is empty.
@@ -110,19 +536,25 @@ class DLL:
         :param back: If True, add val to the back of the DLL. If False, add to the front.
         :return: None.
         """
+        if self._reversed:
+            back = not back
+        position = self.size if back else 0
         self.size += 1
 
         if self.empty():
             self.head = self.tail = Node(val)
-            return None
-
-        if back:
+        elif back:
             self.tail.next = Node(val, None, self.tail, None)
             self.tail = self.tail.next
         else:
             self.head.prev = Node(val, self.head, None, None)
             self.head = self.head.prev
 
+        if self._index is not None:
+            self._index_add(self.tail if back else self.head, back)
+        if self._lanes is not None:
+            self._lanes_insert(self._descend(position - 1), position, self.tail if back else self.head)
+
     def pop(self, back: bool = True) -> None:
         """
         Removes a Node from the back (or front) of the DLL and updates size accordingly
@@ -132,6 +564,13 @@ class DLL:
         """
         if self.empty():
             return None
+        if self._reversed:
+            back = not back
+        if self._index is not None:
+            self._index_discard(self.tail if back else self.head)
+        if self._lanes is not None:
+            position = self.size - 1 if back else 0
+            self._lanes_remove(self._descend(position - 1), self.tail if back else self.head)
         if self.size == 1:
             self.head = self.tail = None
             self.size = 0
@@ -144,20 +583,33 @@ class DLL:
             self.head.prev = None
             self.size -= 1
 
-    def list_to_dll(self, source: List[T]) -> None:
+    def list_to_dll(self, source: Iterable[T]) -> None:
         """
         Creates a DLL from a standard Python list. If there are already nodes in the DLL, the DLL should be cleared and
         replaced by source.
+        Links the whole chain in one pass and sets size once, so any iterable (including a generator, or this DLL's
+        own iter_values) can be loaded without going through push.
 
-        :param source: Standard Python list from which to construct DLL.
+        :param source: Standard Python list (or any iterable) from which to construct DLL.
         :return: None.
         """
-        if not self.empty():
-            self.head = self.tail = None
-            self.size = 0
+        head = tail = None
+        count = 0
+        for value in source:
+            node = Node(value, None, tail)
+            if tail is None:
+                head = node
+            else:
+                tail.next = node
+            tail = node
+            count += 1
 
-        for i in source:
-            self.push(i)
+        # only reset once source is consumed, it may be a generator over this DLL in its current orientation
+        self.head, self.tail, self.size = head, tail, count
+        self._reversed = False
+        self._lanes = None
+        if self._index is not None:
+            self._reindex()
 
     def dll_to_list(self) -> List[T]:
         """
@@ -165,16 +617,24 @@ class DLL:
 
         :return: list[T] containing the values of the nodes in the DLL.
         """
-        dll_list = []
-        if self.empty():
-            return dll_list
+        return list(self.iter_values())
 
-        curNode = self.head
-        while curNode is not None:
-            dll_list.append(curNode.value)
-            curNode = curNode.next
+    def iter_values(self) -> Iterator[T]:
+        """
+        Lazily yields the values of the DLL from head to tail, without building an intermediate list.
 
-        return dll_list
+        :return: generator over the values of the nodes in the DLL.
+        """
+        if self._reversed:
+            curNode = self.tail
+            while curNode is not None:
+                yield curNode.value
+                curNode = curNode.prev
+        else:
+            curNode = self.head
+            while curNode is not None:
+                yield curNode.value
+                curNode = curNode.next
 
     def _find_nodes(self, val: T, find_first: bool = False) -> List[Node]:
         """
@@ -189,14 +649,19 @@ class DLL:
         node_list = []
         if self.empty():
             return node_list
-
-        curNode = self.head
-        while curNode is not None:
+        if self._index is not None:
+            occurrences = self._index.get(val)
+            if occurrences is None:
+                return node_list
+            if self._reversed:
+                return [occurrences[-1]] if find_first else list(reversed(occurrences))
+            return [occurrences[0]] if find_first else list(occurrences)
+
+        for curNode in self._iter_nodes():
             if curNode.value == val:
                 node_list.append(curNode)
                 if find_first:
                     return node_list
-            curNode = curNode.next
 
         return node_list
 
@@ -231,9 +696,21 @@ class DLL:
         :param to_remove: Node to be removed from the DLL.
         :return: None.
         """
+        self._lanes = None
+        self._unlink(to_remove)
+
+    def _unlink(self, to_remove: Node) -> None:
+        """
+        Unlinks a Node from the chain and the value index, leaving the express lanes to the caller.
+
+        :param to_remove: Node to be unlinked from the DLL.
+        :return: None.
+        """
         prevNode = to_remove.prev
         sucNode = to_remove.next
         self.size -= 1
+        if self._index is not None:
+            self._index_discard(to_remove)
 
         if prevNode and sucNode:
             prevNode.next = sucNode
@@ -277,11 +754,30 @@ class DLL:
 
     def reverse(self) -> None:
         """
-        Reverses the DLL in-place by modifying all next and prev references of Node objects in DLL.
-        Updates self.head and self.tail accordingly.
+        Reverses the DLL in O(1) by flipping its logical orientation. push, pop, find, find_all, dll_to_list and
+        __repr__ honour the orientation; call materialize to relink the Nodes themselves.
+
+        :return: None.
+        """
+        self._reversed = not self._reversed
+
+    def materialize(self) -> None:
+        """
+        Physically applies a pending lazy reverse by modifying all next and prev references of Node objects in DLL.
+        Updates self.head and self.tail accordingly. Does nothing if the DLL is not reversed.
+
+        :return: None.
+        """
+        if self._reversed:
+            self._flip()
+
+    def _flip(self) -> None:
+        """
+        Reverses the physical order of the Nodes and toggles the orientation flag, so the logical order is kept.
 
         :return: None.
         """
+        self._reversed = not self._reversed
         if self.empty():
             return None
 
@@ -293,6 +789,871 @@ class DLL:
             curNode = curNode.prev
 
         self.head, self.tail = self.tail, self.head
+        self._lanes = None
+        if self._index is not None:
+            for occurrences in self._index.values():
+                occurrences.reverse()
+
+    def sort(self, *, comparator: Callable[[T, T], bool] = lambda x, y: x < y, descending: bool = False) -> None:
+        """
+        Sorts the DLL in place with a stable bottom-up merge sort that only relinks next and prev references, so no
+        Node is reallocated. O(n log n) time and O(1) extra space.
+
+        :param comparator: A function which takes two arguments of type T and returns True when the first argument
+        should be treated as less than the second argument.
+        :param descending: Perform the sort in descending order when this is True. Defaults to False.
+        :return: None.
+        """
+        if self.head is None or self.head.next is None:
+            return None
+        # a lazily reversed DLL is sorted physically in the opposite order, which keeps ties in logical order
+        before = _ordering(comparator, descending != self._reversed)
+
+        width = 1
+        while True:
+            merges = 0
+            head = tail = None
+            left = self.head
+            while left is not None:
+                right = _cut_after(left, width)
+                rest = _cut_after(right, width)
+                runHead, runTail = _merge_runs(left, right, before)
+                if tail is None:
+                    head = runHead
+                else:
+                    tail.next = runHead
+                runHead.prev = tail
+                tail = runTail
+                merges += 1
+                left = rest
+            self.head, self.tail = head, tail
+            if merges <= 1:
+                break
+            width *= 2
+
+        self._lanes = None
+        if self._index is not None:
+            self._reindex()
+
+    def get(self, index: int) -> T:
+        """
+        Returns the value at a position of the DLL, in O(log n) expected time if the DLL is indexable.
+
+        :param index: position of the value, negative positions count from the back.
+        :return: value at that position.
+        :raises IndexError: if index is out of range.
+        """
+        if index < 0:
+            index += self.size
+        if not 0 <= index < self.size:
+            raise IndexError("DLL index out of range")
+        return self._node_at(self._physical(index)).value
+
+    def __getitem__(self, key: Union[int, slice]) -> Union[T, "DLL"]:
+        """
+        Returns the value at a position of the DLL, or a new DLL holding the values of a slice of it.
+
+        :param key: position (negative positions count from the back) or slice.
+        :return: value at position key, or a DLL of the sliced values.
+        """
+        if isinstance(key, slice):
+            result = self.__class__()
+            result.list_to_dll(self._slice_values(range(*key.indices(self.size))))
+            return result
+        return self.get(key)
+
+    def insert_at(self, index: int, val: T) -> None:
+        """
+        Inserts a Node containing val so that it ends up at a position of the DLL, in O(log n) expected time if the
+        DLL is indexable.
+
+        :param index: position of the new Node, from 0 to size; negative positions count from the back.
+        :param val: value to be added to the DLL.
+        :return: None.
+        :raises IndexError: if index is out of range.
+        """
+        if index < 0:
+            index += self.size
+        if not 0 <= index <= self.size:
+            raise IndexError("DLL index out of range")
+        position = self.size - index if self._reversed else index
+        if position == 0 or position == self.size:
+            self.push(val, (position == self.size) != self._reversed)
+            return None
+
+        if self._ready_lanes() is not None:
+            path = self._descend(position - 1)
+            sucNode = self._walk(path, position)
+        else:
+            path, sucNode = None, self._node_at(position)
+        node = Node(val, sucNode, sucNode.prev)
+        sucNode.prev.next = node
+        sucNode.prev = node
+        self.size += 1
+        if self._index is not None:
+            self._index_insert(node)
+        if path is not None:
+            self._lanes_insert(path, position, node)
+
+    def remove_at(self, index: int) -> T:
+        """
+        Removes the Node at a position of the DLL, in O(log n) expected time if the DLL is indexable.
+
+        :param index: position of the Node, negative positions count from the back.
+        :return: value of the removed Node.
+        :raises IndexError: if index is out of range.
+        """
+        if index < 0:
+            index += self.size
+        if not 0 <= index < self.size:
+            raise IndexError("DLL index out of range")
+        position = self._physical(index)
+        if self._ready_lanes() is not None:
+            path = self._descend(position - 1)
+            to_remove = self._walk(path, position)
+            self._lanes_remove(path, to_remove)
+        else:
+            to_remove = self._node_at(position)
+        self._unlink(to_remove)
+        return to_remove.value
+
+    def cursor(self, node: Node = None) -> "DLLCursor":
+        """
+        Returns a cursor for O(1) edits around a Node of the DLL.
+
+        :param node: Node of this DLL to start at, None for the front of the DLL.
+        :return: DLLCursor on node.
+        """
+        if node is None:
+            node = self.tail if self._reversed else self.head
+        return DLLCursor(self, node)
+
+    def detach(self, node: Node) -> Node:
+        """
+        Unlinks a Node from the DLL without discarding it, so it can be attached again (to this or another DLL)
+        without allocating. O(1), plus O(k) for k occurrences of its value if the DLL has a value index and node is
+        neither the first nor the last of them; express lanes are dropped.
+
+        :param node: Node of this DLL.
+        :return: node, with its next and prev references cleared.
+        """
+        self._remove_node(node)
+        node.next = node.prev = None
+        return node
+
+    def attach(self, node: Node, back: bool = True) -> None:
+        """
+        Links a detached Node in at the back (or front) of the DLL, reusing it instead of allocating. O(1); express
+        lanes are dropped.
+
+        :param node: Node that is not linked into any DLL.
+        :param back: If True, attach node at the back of the DLL. If False, at the front.
+        :return: None.
+        """
+        if self._reversed:
+            back = not back
+        self._attach(self.tail if back else None, node)
+
+    def _link_after(self, after: Node, val: T) -> Node:
+        """
+        Links a new Node containing val in physically right after a Node of the DLL, or in front of self.head.
+
+        :param after: Node to link after, None to link in front of self.head.
+        :param val: value of the new Node.
+        :return: the new Node.
+        """
+        node = Node(val)
+        self._attach(after, node)
+        return node
+
+    def _attach(self, after: Node, node: Node) -> None:
+        """
+        Links a Node in physically right after a Node of the DLL, or in front of self.head.
+
+        :param after: Node to link after, None to link in front of self.head.
+        :param node: Node to link in.
+        :return: None.
+        """
+        before = self.head if after is None else after.next
+        node.next, node.prev = before, after
+        if after is None:
+            self.head = node
+        else:
+            after.next = node
+        if before is None:
+            self.tail = node
+        else:
+            before.prev = node
+        self.size += 1
+        self._lanes = None
+
+        if self._index is not None:
+            if before is None:
+                self._index_add(node, True)
+            elif after is None:
+                self._index_add(node, False)
+            else:
+                self._index_insert(node)
+
+    def flatten(self) -> None:
+        """
+        Flattens a multi-level DLL in place: the chain hanging off each Node's child is relinked in right after that
+        Node, depth-first, and child references are cleared. Works iteratively with an explicit stack of pending
+        continuations, so deep nesting does not recurse. Updates size to count every Node. O(n).
+
+        :return: None.
+        """
+        self.materialize()
+        pending = []
+        count = 0
+        curNode, last = self.head, None
+        while curNode is not None:
+            count += 1
+            if curNode.child is not None:
+                if curNode.next is not None:
+                    pending.append(curNode.next)
+                curNode.next, curNode.child = curNode.child, None
+            elif curNode.next is None and pending:
+                curNode.next = pending.pop()
+            if curNode.next is not None:
+                curNode.next.prev = curNode
+            last, curNode = curNode, curNode.next
+
+        self.tail = last
+        self.size = count
+        self._lanes = None
+        if self._index is not None:
+            self._reindex()
+
+    def iter_flat(self) -> Iterator[T]:
+        """
+        Lazily yields the values of a multi-level DLL depth-first, in the order flatten would leave them, without
+        modifying it. Extra memory is bounded by the nesting depth.
+
+        :return: generator over the values of every level of the DLL.
+        """
+        pending = []
+        curNode, forward = (self.tail, False) if self._reversed else (self.head, True)
+        while True:
+            while curNode is not None:
+                yield curNode.value
+                following = curNode.next if forward else curNode.prev
+                if curNode.child is not None:
+                    if following is not None:
+                        pending.append((following, forward))
+                    curNode, forward = curNode.child, True
+                else:
+                    curNode = following
+            if not pending:
+                return None
+            curNode, forward = pending.pop()
+
+    def _adopt(self, other: "DLL", after: Node) -> None:
+        """
+        Moves every Node of other into this DLL, physically right after a Node of it, by relinking the endpoints.
+        Both DLLs must have the same orientation. Leaves other empty.
+
+        :param other: DLL whose Nodes are moved.
+        :param after: Node of this DLL to link the chain of other after, None to link it in front of self.head.
+        :return: None.
+        """
+        first, last = other.head, other.tail
+        before = self.head if after is None else after.next
+        first.prev, last.next = after, before
+        if after is None:
+            self.head = first
+        else:
+            after.next = first
+        if before is None:
+            self.tail = last
+        else:
+            before.prev = last
+        self.size += other.size
+        self._lanes = None
+
+        if self._index is not None:
+            if after is None:
+                curNode = last
+                while curNode is not after:
+                    self._index_add(curNode, False)
+                    curNode = curNode.prev
+            elif before is None:
+                curNode = first
+                while curNode is not None:
+                    self._index_add(curNode, True)
+                    curNode = curNode.next
+            else:
+                self._reindex()
+
+        other.head = other.tail = None
+        other.size = 0
+        other._reversed = False
+        other._lanes = None
+        if other._index is not None:
+            other._index = {}
+
+    def _align(self, other: "DLL") -> None:
+        """
+        Makes the physical orientation of two DLLs agree by flipping the shorter one if they differ.
+
+        :param other: DLL to align with this one.
+        :return: None.
+        """
+        if self._reversed != other._reversed:
+            if other.size <= self.size:
+                other._flip()
+            else:
+                self._flip()
+
+    def concat(self, other: "DLL") -> None:
+        """
+        Moves every Node of other to the back of this DLL by relinking the endpoints, leaving other empty.
+        O(1), plus O(min(n, k)) if exactly one of the DLLs is lazily reversed and O(k) if this DLL has a value index.
+
+        :param other: DLL whose Nodes are appended.
+        :return: None.
+        """
+        if other is self:
+            raise ValueError("cannot concat a DLL with itself")
+        if other.empty():
+            return None
+        self._align(other)
+        self._adopt(other, None if self._reversed else self.tail)
+
+    def splice_after(self, node: Node, other: "DLL") -> None:
+        """
+        Moves every Node of other into this DLL right after node by relinking the endpoints, leaving other empty.
+        O(1), plus O(min(n, k)) if exactly one of the DLLs is lazily reversed. If this DLL has a value index, that
+        adds O(k) at either end of the DLL and O(n + k) elsewhere.
+
+        :param node: Node of this DLL to splice after, None to splice other in at the front.
+        :param other: DLL whose Nodes are spliced in.
+        :return: None.
+        """
+        if other is self:
+            raise ValueError("cannot splice a DLL into itself")
+        if other.empty():
+            return None
+        self._align(other)
+        if self._reversed:
+            self._adopt(other, self.tail if node is None else node.prev)
+        else:
+            self._adopt(other, node)
+
+    def split_at(self, node: Node, count: int = None) -> "DLL":
+        """
+        Moves node and every Node after it into a new DLL by relinking the endpoints.
+
+        :param node: Node of this DLL to split at, None to split off nothing.
+        :param count: number of Nodes being moved, if the caller knows it. Otherwise it is counted, which takes
+        O(min(k, n - k)) time, or O(k) if this DLL has a value index.
+        :return: new DLL holding node and the Nodes after it, with the same modes and orientation as this DLL.
+        """
+        result = self.__class__(self._index is not None, self._indexable)
+        if node is None:
+            return result
+        result._reversed = self._reversed
+        if self._reversed:
+            first, last = self.head, node
+        else:
+            first, last = node, self.tail
+
+        if count is None:
+            forward, backward, steps = node, node, 0
+            while True:
+                forward = forward.prev if self._reversed else forward.next
+                backward = backward.next if self._reversed else backward.prev
+                steps += 1
+                if forward is None:
+                    count = steps
+                    break
+                if backward is None:
+                    count = self.size - steps + 1
+                    break
+
+        if self._index is not None:
+            # moved Nodes are the last (or, reversed, the first) of their values' occurrences
+            curNode, stop = (first, last.next) if self._reversed else (last, first.prev)
+            while curNode is not stop:
+                self._index_discard(curNode)
+                result._index_add(curNode, self._reversed)
+                curNode = curNode.next if self._reversed else curNode.prev
+
+        if self._reversed:
+            self.head = last.next
+        else:
+            self.tail = first.prev
+        if self.head is None or self.tail is None:
+            self.head = self.tail = None
+        elif self._reversed:
+            self.head.prev = None
+        else:
+            self.tail.next = None
+        first.prev = last.next = None
+
+        result.head, result.tail, result.size = first, last, count
+        self.size -= count
+        self._lanes = None
+        return result
+
+
+class DLLCursor:
+    """
+    Cursor holding a Node of a DLL, for O(1) edits around it without searching. A cursor stays valid across any
+    mutation that does not remove (or move to another DLL) its own Node, including lazy reverses.
+    Edits are O(1) on a plain DLL. With a value index, inserts must find their place among the occurrences of the
+    value and removals must unlink the Node from them (see insert_before and remove). With express lanes
+    (indexable), every edit drops the lanes, so the next positional access rebuilds them in O(n).
+    """
+    __slots__ = ["dll", "node"]
+
+    def __init__(self, dll: DLL, node: Node) -> None:
+        """
+        Construct a cursor. Prefer DLL.cursor.
+
+        :param dll: DLL the cursor edits.
+        :param node: Node of dll the cursor is on, None only if dll is empty.
+        :return: None.
+        """
+        self.dll = dll
+        self.node = node
+
+    def __repr__(self) -> str:
+        """
+        Represent the cursor as a string.
+
+        :return: string representation of the cursor.
+        """
+        return f"DLLCursor({self.node})"
+
+    @property
+    def value(self) -> T:
+        """
+        Value of the Node the cursor is on.
+
+        :return: value held by the cursor's Node.
+        """
+        return self.node.value
+
+    def move(self, k: int) -> None:
+        """
+        Moves the cursor k Nodes towards the back of the DLL (towards the front if k is negative). O(|k|).
+
+        :param k: number of Nodes to move by.
+        :return: None.
+        :raises IndexError: if that would move past either end of the DLL, in which case the cursor does not move.
+        """
+        forward = (k > 0) != self.dll._reversed
+        node = self.node
+        for _ in range(abs(k)):
+            node = None if node is None else node.next if forward else node.prev
+            if node is None:
+                raise IndexError("cursor moved past the end of the DLL")
+        self.node = node
+
+    def insert_before(self, val: T) -> Node:
+        """
+        Inserts a Node containing val right before the cursor's Node. The cursor does not move.
+        O(1), except that a value index first searches outwards from the new Node for the nearest occurrence of val
+        (up to O(n)) and inserts among its occurrences in O(k); express lanes are dropped.
+
+        :param val: value to be added to the DLL.
+        :return: the new Node.
+        """
+        if self.node is None:
+            return self._insert_first(val)
+        return self.dll._link_after(self.node if self.dll._reversed else self.node.prev, val)
+
+    def insert_after(self, val: T) -> Node:
+        """
+        Inserts a Node containing val right after the cursor's Node. The cursor does not move.
+        Costs as insert_before.
+
+        :param val: value to be added to the DLL.
+        :return: the new Node.
+        """
+        if self.node is None:
+            return self._insert_first(val)
+        return self.dll._link_after(self.node.prev if self.dll._reversed else self.node, val)
+
+    def _insert_first(self, val: T) -> Node:
+        """
+        Inserts into the DLL of a cursor that is not on a Node, and moves the cursor onto the new Node.
+
+        :param val: value to be added to the DLL.
+        :return: the new Node.
+        """
+        self.dll.push(val)
+        self.node = self.dll.head if self.dll._reversed else self.dll.tail
+        return self.node
+
+    def remove(self) -> T:
+        """
+        Removes the cursor's Node from the DLL and moves the cursor to the next Node, or to the previous one if it
+        removed the last Node. O(1), plus O(k) for k occurrences of its value if the DLL has a value index (O(1) when
+        it is the first or last of them); express lanes are dropped.
+
+        :return: value of the removed Node.
+        :raises IndexError: if the cursor is not on a Node.
+        """
+        to_remove = self.node
+        if to_remove is None:
+            raise IndexError("cursor is not on a Node")
+        following, preceding = to_remove.next, to_remove.prev
+        if self.dll._reversed:
+            following, preceding = preceding, following
+        self.dll._remove_node(to_remove)
+        self.node = following if following is not None else preceding
+        return to_remove.value
+
+
+class _CacheEntry:
+    """
+    Entry of an LRUCache or LFUCache, held as the value of its Node.
+    """
+    __slots__ = ["key", "value", "weight", "node", "bucket"]
+
+    def __init__(self, key: Hashable, value: T, weight: int) -> None:
+        """
+        Construct a cache entry.
+
+        :param key: key of the entry.
+        :param value: cached value.
+        :param weight: weight of the entry towards the capacity of the cache.
+        :return: None.
+        """
+        self.key = key
+        self.value = value
+        self.weight = weight
+        self.node = Node(self)
+        # Node of the LFUCache frequency bucket holding this entry, unused by LRUCache
+        self.bucket = None
+
+
+class _Cache(ABC):
+    """
+    Bookkeeping shared by LRUCache and LFUCache: entries by key, the weight limit, eviction and counters.
+    Subclasses decide where entries live and which one is evicted next.
+    """
+
+    def __init__(self, capacity: int, weigher: Callable[[Hashable, T], int] = None,
+                 on_evict: Callable[[Hashable, T], None] = None) -> None:
+        """
+        Construct an empty cache.
+
+        :param capacity: maximum total weight of the cached entries.
+        :param weigher: returns the weight of a key and value, every entry weighs 1 if None.
+        :param on_evict: called with the key and value of every entry evicted to respect capacity.
+        :return: None.
+        """
+        if capacity <= 0:
+            raise ValueError("capacity must be positive")
+        self.capacity = capacity
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._weigher = weigher
+        self._on_evict = on_evict
+        self._entries: Dict[Hashable, _CacheEntry] = {}
+        self._weight = 0
+
+    def __len__(self) -> int:
+        """
+        Number of cached entries.
+
+        :return: number of entries.
+        """
+        return len(self._entries)
+
+    def __contains__(self, key: Hashable) -> bool:
+        """
+        Whether key is cached, without counting a hit or miss or refreshing the entry.
+
+        :param key: key to look for.
+        :return: True if key is cached, else False.
+        """
+        return key in self._entries
+
+    @property
+    def weight(self) -> int:
+        """
+        Total weight of the cached entries.
+
+        :return: total weight, at most capacity.
+        """
+        return self._weight
+
+    def get(self, key: Hashable, default: T = None) -> T:
+        """
+        Returns the value cached for key, counting a hit (and refreshing the entry) or a miss. O(1).
+
+        :param key: key to look up.
+        :param default: returned if key is not cached.
+        :return: cached value, or default.
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return default
+        self.hits += 1
+        self._touch(entry)
+        return entry.value
+
+    def put(self, key: Hashable, value: T) -> None:
+        """
+        Caches value for key, replacing (and refreshing) any entry for key, and evicts other entries until the total
+        weight fits capacity. An entry heavier than capacity on its own is evicted straight away. O(1) per entry
+        evicted.
+
+        :param key: key of the entry.
+        :param value: value to cache.
+        :return: None.
+        """
+        weight = 1 if self._weigher is None else self._weigher(key, value)
+        entry = self._entries.get(key)
+        if weight > self.capacity:
+            if entry is not None:
+                self.remove(key)
+            self._evicted(key, value)
+            return None
+
+        if entry is None:
+            # make room first, so a new entry is never its own victim
+            self._evict_to(self.capacity - weight)
+            entry = self._entries[key] = _CacheEntry(key, value, weight)
+            self._insert(entry)
+            self._weight += weight
+        else:
+            self._weight += weight - entry.weight
+            entry.value, entry.weight = value, weight
+            self._touch(entry)
+            self._evict_to(self.capacity)
+
+    def _evict_to(self, limit: int) -> None:
+        """
+        Evicts entries until the total weight is at most limit.
+
+        :param limit: total weight to get down to.
+        :return: None.
+        """
+        while self._weight > limit:
+            victim = self._victim()
+            self.remove(victim.key)
+            self._evicted(victim.key, victim.value)
+
+    def remove(self, key: Hashable) -> bool:
+        """
+        Drops the entry for key, without counting an eviction. O(1).
+
+        :param key: key of the entry.
+        :return: True if key was cached and has been removed, else False.
+        """
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return False
+        self._discard(entry)
+        self._weight -= entry.weight
+        return True
+
+    def _evicted(self, key: Hashable, value: T) -> None:
+        """
+        Counts an eviction and reports it to the eviction callback.
+
+        :param key: key of the evicted entry.
+        :param value: value of the evicted entry.
+        :return: None.
+        """
+        self.evictions += 1
+        if self._on_evict is not None:
+            self._on_evict(key, value)
+
+    @abstractmethod
+    def _insert(self, entry: _CacheEntry) -> None:
+        """
+        Links the Node of a new entry in.
+
+        :param entry: entry that was just added.
+        :return: None.
+        """
+
+    @abstractmethod
+    def _touch(self, entry: _CacheEntry) -> None:
+        """
+        Relocates the Node of an entry that was just used.
+
+        :param entry: entry that was hit or replaced.
+        :return: None.
+        """
+
+    @abstractmethod
+    def _discard(self, entry: _CacheEntry) -> None:
+        """
+        Unlinks the Node of an entry that is being removed.
+
+        :param entry: entry being removed.
+        :return: None.
+        """
+
+    @abstractmethod
+    def _victim(self) -> _CacheEntry:
+        """
+        Picks the entry to evict next.
+
+        :return: entry to evict, the cache is not empty.
+        """
+
+
+class LRUCache(_Cache):
+    """
+    Least-recently-used cache. Entries live on a DLL, most recently used at the front; a hit relocates the
+    entry's existing Node to the front and eviction takes the Node at the back, both in O(1).
+    """
+
+    def __init__(self, capacity: int, weigher: Callable[[Hashable, T], int] = None,
+                 on_evict: Callable[[Hashable, T], None] = None) -> None:
+        """
+        Construct an empty LRU cache.
+
+        :param capacity: maximum total weight of the cached entries.
+        :param weigher: returns the weight of a key and value, every entry weighs 1 if None.
+        :param on_evict: called with the key and value of every entry evicted to respect capacity.
+        :return: None.
+        """
+        super().__init__(capacity, weigher, on_evict)
+        self._order = DLL()
+
+    def _insert(self, entry: _CacheEntry) -> None:
+        """
+        Links a new entry in at the front, as the most recently used.
+
+        :param entry: entry that was just added.
+        :return: None.
+        """
+        self._order.attach(entry.node, False)
+
+    def _touch(self, entry: _CacheEntry) -> None:
+        """
+        Moves the Node of a used entry to the front, without allocating.
+
+        :param entry: entry that was hit or replaced.
+        :return: None.
+        """
+        if entry.node is not self._order.head:
+            self._order.attach(self._order.detach(entry.node), False)
+
+    def _discard(self, entry: _CacheEntry) -> None:
+        """
+        Unlinks the Node of an entry that is being removed.
+
+        :param entry: entry being removed.
+        :return: None.
+        """
+        self._order.detach(entry.node)
+
+    def _victim(self) -> _CacheEntry:
+        """
+        Picks the least recently used entry, at the back.
+
+        :return: entry to evict.
+        """
+        return self._order.tail.value
+
+
+class _FrequencyBucket:
+    """
+    Entries of an LFUCache that have been used the same number of times, most recently used first.
+    """
+    __slots__ = ["count", "entries"]
+
+    def __init__(self, count: int) -> None:
+        """
+        Construct an empty frequency bucket.
+
+        :param count: number of uses shared by the entries of the bucket.
+        :return: None.
+        """
+        self.count = count
+        self.entries = DLL()
+
+
+class LFUCache(_Cache):
+    """
+    Least-frequently-used cache, evicting the least recently used of the least frequently used entries.
+    Entries live in frequency buckets, themselves kept on a DLL in increasing order of use count; a hit moves the
+    entry's existing Node to the next bucket and eviction takes the back of the first bucket, both in O(1).
+    """
+
+    def __init__(self, capacity: int, weigher: Callable[[Hashable, T], int] = None,
+                 on_evict: Callable[[Hashable, T], None] = None) -> None:
+        """
+        Construct an empty LFU cache.
+
+        :param capacity: maximum total weight of the cached entries.
+        :param weigher: returns the weight of a key and value, every entry weighs 1 if None.
+        :param on_evict: called with the key and value of every entry evicted to respect capacity.
+        :return: None.
+        """
+        super().__init__(capacity, weigher, on_evict)
+        self._buckets = DLL()
+
+    def frequency(self, key: Hashable) -> int:
+        """
+        Number of times key has been put or hit since it was cached.
+
+        :param key: key of the entry.
+        :return: use count of the entry, 0 if key is not cached.
+        """
+        entry = self._entries.get(key)
+        return 0 if entry is None else entry.bucket.value.count
+
+    def _insert(self, entry: _CacheEntry) -> None:
+        """
+        Links a new entry in at the front of the bucket for a single use, creating that bucket if needed.
+
+        :param entry: entry that was just added.
+        :return: None.
+        """
+        first = self._buckets.head
+        if first is None or first.value.count != 1:
+            first = self._buckets._link_after(None, _FrequencyBucket(1))
+        first.value.entries.attach(entry.node, False)
+        entry.bucket = first
+
+    def _touch(self, entry: _CacheEntry) -> None:
+        """
+        Moves the Node of a used entry to the front of the bucket for one more use, creating that bucket if needed
+        and dropping the old bucket if it empties.
+
+        :param entry: entry that was hit or replaced.
+        :return: None.
+        """
+        bucket = entry.bucket
+        following = bucket.next
+        if following is None or following.value.count != bucket.value.count + 1:
+            following = self._buckets._link_after(bucket, _FrequencyBucket(bucket.value.count + 1))
+        self._discard(entry)
+        following.value.entries.attach(entry.node, False)
+        entry.bucket = following
+
+    def _discard(self, entry: _CacheEntry) -> None:
+        """
+        Unlinks the Node of an entry from its bucket, dropping the bucket if it empties.
+
+        :param entry: entry being removed.
+        :return: None.
+        """
+        entries = entry.bucket.value.entries
+        entries.detach(entry.node)
+        if entries.empty():
+            self._buckets.detach(entry.bucket)
+
+    def _victim(self) -> _CacheEntry:
+        """
+        Picks the least recently used entry of the least frequently used bucket.
+
+        :return: entry to evict.
+        """
+        return self._buckets.head.value.entries.tail.value
 
 
 class BrowserHistory:
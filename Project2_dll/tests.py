@@ -6,10 +6,11 @@ Originally Authored By: Andrew McDonald, Alex Woodring & Andrew Haas
 tests.py
 """
 
-from solution import DLL, Node, BrowserHistory
+from solution import DLL, Node, BrowserHistory, LRUCache, LFUCache, _Cache
 from typing import TypeVar, List
 from random import seed, randint, shuffle
 import copy
+import pickle
 import unittest
 import string
 
@@ -242,6 +243,85 @@ class DLLTests(unittest.TestCase):
             output = dll.dll_to_list()
             self.check_dll(output, dll)  # if failure here, see (2)
 
+    def test_bulk_load(self):
+
+        # (1) load from a generator and from other non-list iterables
+        dll = DLL()
+        dll.list_to_dll(i * i for i in range(10))
+        self.check_dll([i * i for i in range(10)], dll)  # if failure here, see (1)
+        dll.list_to_dll(range(3))
+        self.check_dll([0, 1, 2], dll)  # if failure here, see (1)
+        dll.list_to_dll(iter([]))
+        self.check_dll([], dll)  # if failure here, see (1)
+
+        # (2) iter_values is lazy and matches dll_to_list
+        dll.list_to_dll(range(5))
+        values = dll.iter_values()
+        self.assertEqual(0, next(values))  # if failure here, see (2)
+        self.assertEqual([1, 2, 3, 4], list(values))  # if failure here, see (2)
+        self.assertEqual([], list(DLL().iter_values()))  # if failure here, see (2)
+
+        # (3) a DLL can be reloaded from its own values
+        dll.list_to_dll(v * 2 for v in dll.iter_values())
+        self.check_dll([0, 2, 4, 6, 8], dll)  # if failure here, see (3)
+
+        # (4) large inputs load in one pass
+        source = list(range(200000))
+        dll.list_to_dll(iter(source))
+        self.assertEqual(source, dll.dll_to_list())  # if failure here, see (4)
+        self.assertEqual(200000, dll.size)  # if failure here, see (4)
+
+        # (5) bulk loading rebuilds the value index
+        dll = DLL(indexed=True)
+        dll.list_to_dll([1, 2, 1])
+        dll.list_to_dll(v for v in [3, 1, 3])
+        self.assertIsNone(dll.find(2))  # if failure here, see (5)
+        self.assertEqual([dll.head, dll.tail], dll.find_all(3))  # if failure here, see (5)
+
+    def test_pickle(self):
+
+        # (1) round-trip an empty DLL
+        dll = pickle.loads(pickle.dumps(DLL()))
+        self.check_dll([], dll)  # if failure here, see (1)
+
+        # (2) round-trip a DLL much longer than the recursion limit
+        source = list(range(20000))
+        dll = DLL()
+        dll.list_to_dll(source)
+        restored = pickle.loads(pickle.dumps(dll))
+        self.check_dll(source, restored)  # if failure here, see (2)
+        self.assertIsNot(dll.head, restored.head)  # if failure here, see (2)
+
+        # (3) deep and shallow copies are independent chains
+        dll = DLL()
+        dll.list_to_dll([[1], [2]])
+        shallow, deep = copy.copy(dll), copy.deepcopy(dll)
+        shallow.pop()
+        self.check_dll([[1], [2]], dll)  # if failure here, see (3)
+        self.check_dll([[1]], shallow)  # if failure here, see (3)
+        self.assertIs(dll.head.value, shallow.head.value)  # if failure here, see (3)
+        self.assertIsNot(dll.head.value, deep.head.value)  # if failure here, see (3)
+
+        # (4) child levels, including deep nesting, survive a round-trip
+        dll = DLL()
+        dll.list_to_dll([1, 2, 3])
+        node = dll.head.next
+        for depth in range(5000):
+            node.child = Node(depth)
+            node = node.child
+        dll.tail.child = Node('a')
+        dll.tail.child.next = Node('b', prev=dll.tail.child)
+        restored = pickle.loads(pickle.dumps(dll))
+        self.check_dll([1, 2, 3], restored)  # if failure here, see (4)
+        self.assertIsNone(restored.head.child)  # if failure here, see (4)
+        node, depth = restored.head.next.child, 0
+        while node is not None:
+            self.assertEqual(depth, node.value)  # if failure here, see (4)
+            node, depth = node.child, depth + 1
+        self.assertEqual(5000, depth)  # if failure here, see (4)
+        self.assertEqual('b', restored.tail.child.next.value)  # if failure here, see (4)
+        self.assertIs(restored.tail.child, restored.tail.child.next.prev)  # if failure here, see (4)
+
     def test_find(self):
 
         # (1) find in empty DLL
@@ -535,12 +615,15 @@ class DLLTests(unittest.TestCase):
         # (1) reverse empty DLL
         dll = DLL()
         dll.reverse()
+        self.assertEqual([], dll.dll_to_list())  # if failure here, see (1)
+        dll.materialize()
         self.check_dll([], dll)  # if failure here, see (1)
 
         # (2) reverse single-node DLL
         dll = DLL()
         dll.push(0)
         dll.reverse()
+        dll.materialize()
         self.check_dll([0], dll)  # if failure here, see (2)
 
         # (3) reverse longer DLL
@@ -551,8 +634,10 @@ class DLLTests(unittest.TestCase):
             lst.append(i)
         old_head, old_tail = dll.head, dll.tail
         dll.reverse()
-        new_head, new_tail = dll.head, dll.tail
         lst.reverse()
+        self.assertEqual(lst, dll.dll_to_list())  # if failure here, see (3)
+        dll.materialize()
+        new_head, new_tail = dll.head, dll.tail
 
         self.check_dll(lst, dll)
         self.assertIs(new_head, old_tail)
@@ -569,6 +654,7 @@ class DLLTests(unittest.TestCase):
             lst.append(i)
         old_head, old_tail = dll.head, dll.tail
         dll.reverse()
+        dll.materialize()
         new_head, new_tail = dll.head, dll.tail
         lst.reverse()
 
@@ -576,6 +662,462 @@ class DLLTests(unittest.TestCase):
         self.assertIs(new_head, old_tail)
         self.assertIs(new_tail, old_head)
 
+        # (5) lazy reverse is O(1): nodes are not touched until materialize
+        dll = DLL()
+        dll.list_to_dll([1, 2, 3])
+        head, second = dll.head, dll.head.next
+        dll.reverse()
+        self.assertIs(head, dll.head)  # if failure here, see (5)
+        self.assertIs(second, head.next)  # if failure here, see (5)
+        self.assertEqual("Node(3) <-> Node(2) <-> Node(1)", repr(dll))  # if failure here, see (5)
+
+        # (6) push, pop, find and find_all honour the orientation
+        dll.push(0)
+        dll.push(4, False)
+        self.assertEqual([4, 3, 2, 1, 0], dll.dll_to_list())  # if failure here, see (6)
+        dll.pop(False)
+        dll.pop()
+        dll.push(2)
+        self.assertEqual([3, 2, 1, 2], dll.dll_to_list())  # if failure here, see (6)
+        self.assertIs(dll.tail.prev, dll.find(2))  # if failure here, see (6)
+        self.assertEqual([dll.tail.prev, dll.head], dll.find_all(2))  # if failure here, see (6)
+        self.assertTrue(dll.remove(2))  # if failure here, see (6)
+        self.assertEqual([3, 1, 2], dll.dll_to_list())  # if failure here, see (6)
+
+        # (7) reversing twice restores the original orientation without relinking
+        dll.reverse()
+        dll.reverse()
+        self.assertEqual([3, 1, 2], dll.dll_to_list())  # if failure here, see (7)
+        dll.reverse()
+        dll.materialize()
+        self.check_dll([2, 1, 3], dll)  # if failure here, see (7)
+
+        # (8) a lazily reversed DLL can be reloaded from its own values
+        dll.reverse()
+        dll.list_to_dll(dll.iter_values())
+        self.check_dll([3, 1, 2], dll)  # if failure here, see (8)
+        dll.reverse()
+        dll.list_to_dll(v for v in dll.iter_values())
+        self.check_dll([2, 1, 3], dll)  # if failure here, see (8)
+
+        # (9) orientation survives pickling and is reset by list_to_dll
+        dll.reverse()
+        self.assertEqual([3, 1, 2], pickle.loads(pickle.dumps(dll)).dll_to_list())  # if failure here, see (9)
+        dll.list_to_dll([5, 6])
+        self.check_dll([5, 6], dll)  # if failure here, see (9)
+
+    def test_indexed(self):
+
+        # (1) indexed lookups return the same nodes, in list order, as a plain scan
+        dll = DLL(indexed=True)
+        dll.list_to_dll([1, 2, 1, 3, 1])
+        self.assertIs(dll.head, dll.find(1))  # if failure here, see (1)
+        self.assertEqual([dll.head, dll.head.next.next, dll.tail], dll.find_all(1))  # if failure here, see (1)
+        self.assertIsNone(dll.find(4))  # if failure here, see (1)
+        self.assertEqual([], dll.find_all(4))  # if failure here, see (1)
+
+        # (2) pushes to the front, pops and reverse keep the index in list order
+        dll.push(1, False)
+        self.assertIs(dll.head, dll.find(1))  # if failure here, see (2)
+        dll.pop(False)
+        dll.pop()
+        self.assertIs(dll.tail.prev, dll.find_all(1)[-1])  # if failure here, see (2)
+        dll.reverse()
+        self.assertIs(dll.tail.prev, dll.find(1))  # if failure here, see (2)
+        dll.materialize()
+        self.assertIs(dll.head.next, dll.find(1))  # if failure here, see (2)
+        self.check_dll([3, 1, 2, 1], dll)  # if failure here, see (2)
+
+        # (3) remove and remove_all unlink exactly the indexed nodes
+        self.assertEqual(2, dll.remove_all(1))  # if failure here, see (3)
+        self.assertFalse(dll.remove(1))  # if failure here, see (3)
+        self.assertTrue(dll.remove(3))  # if failure here, see (3)
+        self.check_dll([2], dll)  # if failure here, see (3)
+        self.assertIs(dll.head, dll.find(2))  # if failure here, see (3)
+
+        # (4) randomized operations agree with an unindexed DLL
+        seed(331)
+        plain, indexed = DLL(), DLL(indexed=True)
+        for _ in range(2000):
+            op, val = randint(0, 5), randint(0, 9)
+            if op == 0:
+                plain.push(val), indexed.push(val)
+            elif op == 1:
+                plain.push(val, False), indexed.push(val, False)
+            elif op == 2:
+                back = bool(randint(0, 1))
+                plain.pop(back), indexed.pop(back)
+            elif op == 3:
+                self.assertEqual(plain.remove(val), indexed.remove(val))  # if failure here, see (4)
+            elif op == 4:
+                self.assertEqual(plain.remove_all(val), indexed.remove_all(val))  # if failure here, see (4)
+            else:
+                plain.reverse(), indexed.reverse()
+            expected = [node.value for node in plain.find_all(val)]
+            self.assertEqual(expected, [node.value for node in indexed.find_all(val)])  # if failure here, see (4)
+            found = [node for node in indexed._iter_nodes() if node.value == val]
+            self.assertEqual(found, indexed.find_all(val))  # if failure here, see (4)
+            self.assertIs(found[0] if found else None, indexed.find(val))  # if failure here, see (4)
+        expected = plain.dll_to_list()
+        indexed.materialize()
+        self.check_dll(expected, indexed)  # if failure here, see (4)
+
+        # (5) the index survives pickling
+        restored = pickle.loads(pickle.dumps(indexed))
+        for val in range(10):
+            self.assertEqual(len(indexed.find_all(val)), len(restored.find_all(val)))  # if failure here, see (5)
+            for node in restored.find_all(val):
+                self.assertEqual(val, node.value)  # if failure here, see (5)
+
+    def test_positional(self):
+
+        # (1) get, insert_at and remove_at on a plain DLL
+        dll = DLL()
+        dll.list_to_dll([0, 1, 2, 3])
+        self.assertEqual(2, dll.get(2))  # if failure here, see (1)
+        self.assertEqual(3, dll.get(-1))  # if failure here, see (1)
+        dll.insert_at(1, 'a')
+        dll.insert_at(5, 'b')
+        dll.insert_at(0, 'c')
+        self.check_dll(['c', 0, 'a', 1, 2, 3, 'b'], dll)  # if failure here, see (1)
+        self.assertEqual('a', dll.remove_at(2))  # if failure here, see (1)
+        self.assertEqual('b', dll.remove_at(-1))  # if failure here, see (1)
+        self.check_dll(['c', 0, 1, 2, 3], dll)  # if failure here, see (1)
+
+        # (2) out of range positions raise IndexError
+        with self.assertRaises(IndexError):
+            dll.get(5)
+        with self.assertRaises(IndexError):
+            dll.remove_at(-6)
+        with self.assertRaises(IndexError):
+            dll.insert_at(6, 0)
+        with self.assertRaises(IndexError):
+            DLL(indexable=True).get(0)
+
+        # (3) slicing returns a new DLL and honours a lazy reverse
+        dll = DLL(indexable=True)
+        dll.list_to_dll(range(10))
+        self.check_dll([2, 3, 4], dll[2:5])  # if failure here, see (3)
+        self.check_dll([9, 6, 3, 0], dll[::-3])  # if failure here, see (3)
+        self.check_dll([], dll[5:2])  # if failure here, see (3)
+        dll.reverse()
+        self.assertEqual(9, dll[0])  # if failure here, see (3)
+        self.check_dll([8, 6, 4], dll[1:7:2])  # if failure here, see (3)
+        dll.insert_at(1, 'x')
+        self.assertEqual([9, 'x', 8, 7], dll[:4].dll_to_list())  # if failure here, see (3)
+
+        # (4) randomized positional operations on an indexable DLL agree with a Python list
+        seed(331)
+        for indexed in (False, True):
+            dll, lst = DLL(indexed=indexed, indexable=True), []
+            for _ in range(3000):
+                op, val = randint(0, 6), randint(0, 9)
+                if op == 0:
+                    index = randint(0, len(lst))
+                    dll.insert_at(index, val)
+                    lst.insert(index, val)
+                elif op == 1 and lst:
+                    index = randint(-len(lst), len(lst) - 1)
+                    self.assertEqual(lst.pop(index), dll.remove_at(index))  # if failure here, see (4)
+                elif op == 2 and lst:
+                    index = randint(-len(lst), len(lst) - 1)
+                    self.assertEqual(lst[index], dll.get(index))  # if failure here, see (4)
+                elif op == 3:
+                    back = bool(randint(0, 1))
+                    dll.push(val, back)
+                    lst.insert(len(lst) if back else 0, val)
+                elif op == 4 and lst:
+                    back = bool(randint(0, 1))
+                    dll.pop(back)
+                    lst.pop(-1 if back else 0)
+                elif op == 5:
+                    dll.reverse()
+                    lst.reverse()
+                elif val in lst:
+                    self.assertTrue(dll.remove(val))  # if failure here, see (4)
+                    lst.remove(val)
+                self.assertEqual(len(lst), dll.size)  # if failure here, see (4)
+            self.assertEqual(lst, dll.dll_to_list())  # if failure here, see (4)
+            self.assertEqual(lst[::2], dll[::2].dll_to_list())  # if failure here, see (4)
+            if indexed:
+                self.assertEqual([v for v in lst if v == 3], [node.value for node in dll.find_all(3)])
+            dll.materialize()
+            self.check_dll(lst, dll)  # if failure here, see (4)
+
+    def test_sort(self):
+
+        # (1) sort empty and single-node DLLs
+        dll = DLL()
+        dll.sort()
+        self.check_dll([], dll)  # if failure here, see (1)
+        dll.push(1)
+        dll.sort()
+        self.check_dll([1], dll)  # if failure here, see (1)
+
+        # (2) sorting relinks the existing Nodes instead of allocating new ones
+        dll = DLL()
+        dll.list_to_dll([3, 1, 2])
+        nodes = {node.value: node for node in dll.find_all(1) + dll.find_all(2) + dll.find_all(3)}
+        dll.sort()
+        self.check_dll([1, 2, 3], dll)  # if failure here, see (2)
+        self.assertIs(nodes[1], dll.head)  # if failure here, see (2)
+        self.assertIs(nodes[3], dll.tail)  # if failure here, see (2)
+
+        # (3) comparator, descending and stability
+        seed(331)
+        source = [(randint(0, 9), i) for i in range(500)]
+        for descending in (False, True):
+            dll = DLL()
+            dll.list_to_dll(source)
+            dll.sort(comparator=lambda x, y: x[0] < y[0], descending=descending)
+            expected = sorted(source, key=lambda x: x[0], reverse=descending)
+            self.check_dll(expected, dll)  # if failure here, see (3)
+
+        # (4) a lazily reversed DLL sorts its logical order, ties staying in logical order
+        dll = DLL()
+        dll.list_to_dll(source)
+        dll.reverse()
+        dll.sort(comparator=lambda x, y: x[0] < y[0])
+        expected = sorted(source[::-1], key=lambda x: x[0])
+        self.assertEqual(expected, dll.dll_to_list())  # if failure here, see (4)
+        dll.materialize()
+        self.check_dll(expected, dll)  # if failure here, see (4)
+
+        # (5) value index and positional lanes stay consistent
+        dll = DLL(indexed=True, indexable=True)
+        dll.list_to_dll([5, 1, 4, 1, 3])
+        self.assertEqual(4, dll.get(2))  # if failure here, see (5)
+        dll.sort()
+        self.check_dll([1, 1, 3, 4, 5], dll)  # if failure here, see (5)
+        self.assertEqual([dll.head, dll.head.next], dll.find_all(1))  # if failure here, see (5)
+        self.assertEqual(4, dll.get(3))  # if failure here, see (5)
+
+    def test_concat_splice_split(self):
+
+        # (1) concat moves the Nodes of other, leaving it empty
+        dll, other = DLL(), DLL()
+        dll.list_to_dll([1, 2])
+        other.list_to_dll([3, 4])
+        moved = other.head
+        dll.concat(other)
+        self.check_dll([1, 2, 3, 4], dll)  # if failure here, see (1)
+        self.check_dll([], other)  # if failure here, see (1)
+        self.assertIs(moved, dll.head.next.next)  # if failure here, see (1)
+        dll.concat(other)
+        other.concat(dll)
+        self.check_dll([], dll)  # if failure here, see (1)
+        self.check_dll([1, 2, 3, 4], other)  # if failure here, see (1)
+        with self.assertRaises(ValueError):
+            other.concat(other)
+
+        # (2) splice_after links other in after a Node, or at the front for None
+        dll, other = DLL(), DLL()
+        dll.list_to_dll([1, 4])
+        other.list_to_dll([2, 3])
+        dll.splice_after(dll.head, other)
+        self.check_dll([1, 2, 3, 4], dll)  # if failure here, see (2)
+        other.list_to_dll([0])
+        dll.splice_after(None, other)
+        other.list_to_dll([5])
+        dll.splice_after(dll.tail, other)
+        self.check_dll([0, 1, 2, 3, 4, 5], dll)  # if failure here, see (2)
+
+        # (3) split_at moves a Node and the Nodes after it, counting them if no count is given
+        tail = dll.split_at(dll.find(4))
+        self.check_dll([0, 1, 2, 3], dll)  # if failure here, see (3)
+        self.check_dll([4, 5], tail)  # if failure here, see (3)
+        rest = dll.split_at(dll.head.next, 3)
+        self.check_dll([0], dll)  # if failure here, see (3)
+        self.check_dll([1, 2, 3], rest)  # if failure here, see (3)
+        everything = dll.split_at(dll.head)
+        self.check_dll([], dll)  # if failure here, see (3)
+        self.check_dll([0], everything)  # if failure here, see (3)
+        self.check_dll([], rest.split_at(None))  # if failure here, see (3)
+
+        # (4) lazily reversed DLLs keep their logical order
+        dll, other = DLL(), DLL()
+        dll.list_to_dll([3, 2, 1])
+        other.list_to_dll([4, 5, 6, 7])
+        dll.reverse()
+        other.reverse()
+        dll.concat(other)
+        self.assertEqual([1, 2, 3, 7, 6, 5, 4], dll.dll_to_list())  # if failure here, see (4)
+        other.list_to_dll(['a', 'b'])
+        dll.splice_after(dll.find(3), other)
+        self.assertEqual([1, 2, 3, 'a', 'b', 7, 6, 5, 4], dll.dll_to_list())  # if failure here, see (4)
+        tail = dll.split_at(dll.find(7))
+        self.assertEqual([1, 2, 3, 'a', 'b'], dll.dll_to_list())  # if failure here, see (4)
+        self.assertEqual([7, 6, 5, 4], tail.dll_to_list())  # if failure here, see (4)
+        self.assertEqual(4, tail.size)  # if failure here, see (4)
+        dll.materialize()
+        self.check_dll([1, 2, 3, 'a', 'b'], dll)  # if failure here, see (4)
+
+        # (5) value index and positional lanes follow the moved Nodes
+        dll, other = DLL(indexed=True, indexable=True), DLL(indexed=True)
+        dll.list_to_dll([1, 2, 1])
+        other.list_to_dll([2, 1])
+        self.assertEqual(2, dll.get(1))  # if failure here, see (5)
+        dll.splice_after(dll.head, other)
+        self.check_dll([1, 2, 1, 2, 1], dll)  # if failure here, see (5)
+        self.assertEqual([1, 1, 1], [node.value for node in dll.find_all(1)])  # if failure here, see (5)
+        self.assertIs(dll.head.next.next, dll.find_all(1)[1])  # if failure here, see (5)
+        self.assertEqual(1, dll.get(2))  # if failure here, see (5)
+        tail = dll.split_at(dll.find_all(2)[1])
+        self.assertEqual([dll.head, dll.tail], dll.find_all(1))  # if failure here, see (5)
+        self.assertEqual([tail.head], tail.find_all(2))  # if failure here, see (5)
+        self.assertEqual(1, tail.get(1))  # if failure here, see (5)
+        self.assertIsNone(other.find(1))  # if failure here, see (5)
+
+    def test_cursor(self):
+
+        # (1) a cursor on an empty DLL inserts the first Node and moves onto it
+        dll = DLL()
+        cursor = dll.cursor()
+        self.assertIsNone(cursor.node)  # if failure here, see (1)
+        cursor.insert_after(2)
+        self.assertEqual(2, cursor.value)  # if failure here, see (1)
+        self.check_dll([2], dll)  # if failure here, see (1)
+
+        # (2) insert_before and insert_after link around the cursor without moving it
+        cursor.insert_before(1)
+        cursor.insert_after(4)
+        cursor.insert_after(3)
+        self.assertEqual(2, cursor.value)  # if failure here, see (2)
+        self.check_dll([1, 2, 3, 4], dll)  # if failure here, see (2)
+
+        # (3) move by k in either direction, refusing to leave the DLL
+        cursor.move(2)
+        self.assertIs(dll.tail, cursor.node)  # if failure here, see (3)
+        cursor.move(-3)
+        self.assertIs(dll.head, cursor.node)  # if failure here, see (3)
+        with self.assertRaises(IndexError):
+            cursor.move(-1)
+        with self.assertRaises(IndexError):
+            cursor.move(4)
+        self.assertIs(dll.head, cursor.node)  # if failure here, see (3)
+
+        # (4) remove moves to the next Node, or the previous one at the back
+        self.assertEqual(1, cursor.remove())  # if failure here, see (4)
+        self.assertEqual(2, cursor.value)  # if failure here, see (4)
+        cursor.move(2)
+        self.assertEqual(4, cursor.remove())  # if failure here, see (4)
+        self.assertEqual(3, cursor.value)  # if failure here, see (4)
+        self.check_dll([2, 3], dll)  # if failure here, see (4)
+        cursor.remove()
+        cursor.remove()
+        self.assertIsNone(cursor.node)  # if failure here, see (4)
+        self.check_dll([], dll)  # if failure here, see (4)
+        with self.assertRaises(IndexError):
+            cursor.remove()
+
+        # (5) cursors stay valid across unrelated mutations and lazy reverses
+        dll = DLL(indexed=True)
+        dll.list_to_dll([1, 2, 3, 4, 5])
+        cursor = dll.cursor(dll.find(3))
+        dll.pop()
+        dll.pop(False)
+        dll.push(0, False)
+        dll.remove(2)
+        self.assertEqual(3, cursor.value)  # if failure here, see (5)
+        dll.reverse()
+        cursor.move(1)
+        self.assertEqual(0, cursor.value)  # if failure here, see (5)
+        cursor.insert_after(2)
+        cursor.insert_before(9)
+        self.assertEqual([4, 3, 9, 0, 2], dll.dll_to_list())  # if failure here, see (5)
+        dll.materialize()
+        self.check_dll([4, 3, 9, 0, 2], dll)  # if failure here, see (5)
+        cursor.move(-2)
+        self.assertEqual(3, cursor.remove())  # if failure here, see (5)
+        self.assertEqual(9, cursor.value)  # if failure here, see (5)
+        self.assertIsNone(dll.find(3))  # if failure here, see (5)
+        self.assertIs(dll.tail, dll.find(2))  # if failure here, see (5)
+
+        # (6) a long editing session keeps the DLL consistent
+        dll, lst = DLL(), []
+        cursor, position = dll.cursor(), 0
+        seed(331)
+        for _ in range(5000):
+            op, val = randint(0, 3), randint(0, 9)
+            if op == 0 or not lst:
+                cursor.insert_after(val)
+                lst.insert(position + 1 if lst else 0, val)
+            elif op == 1:
+                cursor.insert_before(val)
+                lst.insert(position, val)
+                position += 1
+            elif op == 2:
+                k = randint(-position, len(lst) - 1 - position)
+                cursor.move(k)
+                position += k
+            else:
+                self.assertEqual(lst.pop(position), cursor.remove())  # if failure here, see (6)
+                position = min(position, len(lst) - 1) if lst else 0
+            if lst:
+                self.assertEqual(lst[position], cursor.value)  # if failure here, see (6)
+        self.check_dll(lst, dll)  # if failure here, see (6)
+
+    def test_flatten(self):
+
+        # (1) flatten a DLL without children, and an empty one
+        dll = DLL()
+        dll.flatten()
+        self.assertEqual([], list(dll.iter_flat()))  # if failure here, see (1)
+        self.check_dll([], dll)  # if failure here, see (1)
+        dll.list_to_dll([1, 2, 3])
+        self.assertEqual([1, 2, 3], list(dll.iter_flat()))  # if failure here, see (1)
+        dll.flatten()
+        self.check_dll([1, 2, 3], dll)  # if failure here, see (1)
+
+        # (2) children are relinked right after their parent, depth-first
+        def level(values):
+            chain = DLL()
+            chain.list_to_dll(values)
+            return chain.head
+
+        dll = DLL()
+        dll.list_to_dll([1, 2, 3, 4])
+        two = dll.head.next
+        two.child = level([5, 6])
+        two.child.next.child = level([7, 8])
+        dll.tail.child = level([9])
+        expected = [1, 2, 5, 6, 7, 8, 3, 4, 9]
+        self.check_dll([1, 2, 3, 4], dll, multilevel=True)  # if failure here, see (2)
+        self.assertEqual(expected, list(dll.iter_flat()))  # if failure here, see (2)
+        self.check_dll([1, 2, 3, 4], dll, multilevel=True)  # if failure here, see (2)
+        dll.flatten()
+        self.check_dll(expected, dll)  # if failure here, see (2)
+        self.assertIsNone(two.child)  # if failure here, see (2)
+
+        # (3) deep nesting neither recurses in flatten nor in iter_flat
+        dll = DLL()
+        dll.list_to_dll([0, 'end'])
+        node = dll.head
+        for depth in range(1, 20000):
+            node.child = Node(depth)
+            node = node.child
+        expected = list(range(20000)) + ['end']
+        self.assertEqual(expected, list(dll.iter_flat()))  # if failure here, see (3)
+        dll.flatten()
+        self.check_dll(expected, dll)  # if failure here, see (3)
+
+        # (4) a lazily reversed DLL flattens its logical order
+        dll = DLL()
+        dll.list_to_dll([1, 2, 3])
+        dll.head.next.child = level(['a', 'b'])
+        dll.reverse()
+        self.assertEqual([3, 2, 'a', 'b', 1], list(dll.iter_flat()))  # if failure here, see (4)
+        dll.flatten()
+        self.check_dll([3, 2, 'a', 'b', 1], dll)  # if failure here, see (4)
+
+        # (5) the value index covers the relinked Nodes
+        dll = DLL(indexed=True)
+        dll.list_to_dll([1, 2])
+        dll.head.child = level([2, 3])
+        dll.flatten()
+        self.assertEqual([dll.head.next, dll.tail], dll.find_all(2))  # if failure here, see (5)
+        self.assertIs(dll.tail.prev, dll.find(3))  # if failure here, see (5)
+
     def test_DLL_comprehensive(self):
         # test empty, append, prepend, pop, search, search_all, remove, remove_all
         dll = DLL()
@@ -790,5 +1332,126 @@ class BrowserHistoryTests(unittest.TestCase):
         self.assertEqual('https://gm.com', bh.get_current_url())
         
 
+
+class CacheTests(unittest.TestCase):
+
+    def test_lru(self):
+        # (1) hits, misses and relocating the existing Node on a hit
+        evicted = []
+        cache = LRUCache(2, on_evict=lambda key, value: evicted.append((key, value)))
+        cache.put('a', 1)
+        cache.put('b', 2)
+        node = cache._entries['a'].node
+        self.assertEqual(1, cache.get('a'))
+        self.assertIs(node, cache._order.head)
+        self.assertIsNone(cache.get('z'))
+        self.assertEqual(0, cache.get('z', 0))
+        self.assertEqual((1, 2), (cache.hits, cache.misses))
+
+        # (2) the least recently used entry is evicted and reported
+        cache.put('c', 3)
+        self.assertEqual([('b', 2)], evicted)
+        self.assertNotIn('b', cache)
+        self.assertEqual(2, len(cache))
+        cache.put('a', 10)
+        cache.put('d', 4)
+        self.assertEqual([('b', 2), ('c', 3)], evicted)
+        self.assertEqual(10, cache.get('a'))
+        self.assertEqual(2, cache.evictions)
+
+        # (3) remove does not count as an eviction
+        self.assertTrue(cache.remove('a'))
+        self.assertFalse(cache.remove('a'))
+        self.assertEqual(2, cache.evictions)
+        self.assertEqual(1, len(cache))
+
+        # (4) weight limit, including an entry too heavy to cache at all
+        evicted = []
+        cache = LRUCache(10, weigher=lambda key, value: len(value), on_evict=lambda key, value: evicted.append(key))
+        cache.put(1, 'aaaa')
+        cache.put(2, 'bbbb')
+        cache.get(1)
+        cache.put(3, 'ccc')
+        self.assertEqual([2], evicted)
+        self.assertEqual(7, cache.weight)
+        cache.put(4, 'x' * 11)
+        self.assertEqual([2, 4], evicted)
+        self.assertEqual(7, cache.weight)
+        cache.put(1, 'a' * 9)
+        self.assertEqual([2, 4, 3], evicted)
+        self.assertEqual(9, cache.weight)
+        with self.assertRaises(ValueError):
+            LRUCache(0)
+
+        # (5) a cache missing one of the hooks cannot be constructed
+        class Incomplete(_Cache):
+            def _insert(self, entry):
+                pass
+
+        with self.assertRaises(TypeError):
+            Incomplete(1)
+
+    def test_lfu(self):
+        # (1) the least frequently used entry is evicted, ties going to the least recently used
+        evicted = []
+        cache = LFUCache(3, on_evict=lambda key, value: evicted.append(key))
+        for key in 'abc':
+            cache.put(key, key.upper())
+        cache.get('a')
+        cache.get('a')
+        cache.get('b')
+        self.assertEqual((3, 2, 1), (cache.frequency('a'), cache.frequency('b'), cache.frequency('c')))
+        cache.put('d', 'D')
+        self.assertEqual(['c'], evicted)
+        cache.put('e', 'E')
+        self.assertEqual(['c', 'd'], evicted)
+        cache.get('e')
+        cache.put('f', 'F')
+        self.assertEqual(['c', 'd', 'b'], evicted)
+        self.assertEqual(0, cache.frequency('b'))
+        self.assertEqual(1, cache.frequency('f'))
+        self.assertEqual((4, 0, 3), (cache.hits, cache.misses, cache.evictions))
+
+        # (2) hits move the existing Node between frequency buckets
+        node = cache._entries['e'].node
+        cache.get('e')
+        self.assertIs(node, cache._entries['e'].node)
+        self.assertEqual(3, cache.frequency('e'))
+        self.assertEqual([1, 3], [bucket.count for bucket in cache._buckets.iter_values()])
+
+        # (3) weight limit evicts as many entries as needed
+        evicted = []
+        cache = LFUCache(5, weigher=lambda key, value: value, on_evict=lambda key, value: evicted.append(key))
+        cache.put('a', 2)
+        cache.put('b', 2)
+        cache.get('b')
+        cache.put('c', 1)
+        cache.put('d', 3)
+        self.assertEqual(['a', 'c'], evicted)
+        self.assertEqual(5, cache.weight)
+        self.assertIsNone(cache.get('a'))
+        self.assertEqual(1, cache.misses)
+
+        # (4) randomized use agrees with a brute-force LFU model
+        seed(331)
+        evicted, expected = [], []
+        cache, model, clock = LFUCache(8, on_evict=lambda key, value: evicted.append(key)), {}, 0
+        for _ in range(3000):
+            key = randint(0, 19)
+            clock += 1
+            if randint(0, 1):
+                self.assertEqual(model[key][0] if key in model else None, cache.get(key))
+                if key in model:
+                    model[key][1:] = [model[key][1] + 1, clock]
+            else:
+                cache.put(key, clock)
+                if key not in model and len(model) == 8:
+                    victim = min(model, key=lambda k: (model[k][1], model[k][2]))
+                    expected.append(victim)
+                    del model[victim]
+                model[key] = [clock, model[key][1] + 1 if key in model else 1, clock]
+        self.assertEqual(expected, evicted)
+
+
 if __name__ == '__main__':
     unittest.main()
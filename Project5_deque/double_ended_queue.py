@@ -278,6 +278,27 @@ class CDLL:
 
     # ============ Modifiy Functions Below ============#
 
+    def __reduce__(self) -> tuple:
+        """
+        Pickles (and copies) the CDLL as a flat list of values, so nodes are not recursed into one by one
+        :return: reconstruction recipe for `pickle`/`copy`
+        """
+        values = []
+        node = self.head
+        for _ in range(self.size):
+            values.append(node.val)
+            node = node.next
+        return self.__class__, (), values
+
+    def __setstate__(self, values: List[T]) -> None:
+        """
+        Relinks an unpickled CDLL from its flat list of values
+        :param values: values from head around to the back
+        :return: None
+        """
+        for val in values:
+            self.insert(val, front=False)
+
     def insert(self, val: T, front: bool = True) -> None:
         """
         inserts a node with value val in the front or back of the CDLL
@@ -7,6 +7,8 @@ tests.py
 import string
 import random
 import unittest
+import pickle
+import copy
 from solution import CircularDeque, CDLL, CDLLCD
 from xml.dom import minidom
 from typing import TypeVar, List, Tuple
@@ -625,6 +627,39 @@ class CDLLTests(unittest.TestCase):
         self.check_cdll(expected_list, cdll)
 
 
+    def test_pickle(self):
+        """
+        Tests pickling and copying a CDLL
+        """
+        # (1) round-trip an empty list
+        cdll = pickle.loads(pickle.dumps(CDLL()))
+        self.check_cdll([], cdll)
+
+        # (2) round-trip a list much longer than the recursion limit
+        cdll = CDLL()
+        for i in range(20000):
+            cdll.insert(i, front=False)
+        restored = pickle.loads(pickle.dumps(cdll))
+        self.check_cdll(list(range(20000)), restored)
+        self.assertIsNot(cdll.head, restored.head)
+
+        # (3) copies are independent lists
+        cdll = CDLL()
+        for i in range(3):
+            cdll.insert(i)
+        duplicate = copy.deepcopy(cdll)
+        duplicate.remove()
+        self.check_cdll([2, 1, 0], cdll)
+        self.check_cdll([1, 0], duplicate)
+
+        # (4) a CDLLCD pickles through its CDLL
+        deque = CDLLCD()
+        for i in range(5000):
+            deque.enqueue(i)
+        restored = pickle.loads(pickle.dumps(deque))
+        self.check_cdll(list(range(4999, -1, -1)), restored.CDLL)
+
+
 class CDLLCDTests(unittest.TestCase):
     def setUp(self):
         self.cdllcd = CDLLCD()